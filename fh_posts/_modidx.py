@@ -6,18 +6,230 @@ d = { 'settings': { 'branch': 'main',
                 'git_url': 'https://github.com/decherd/fh_posts',
                 'lib_path': 'fh_posts'},
   'syms': { 'fh_posts.all': {},
-            'fh_posts.core': { 'fh_posts.core.Post': ('core.html#post', 'fh_posts/core.py'),
+            'fh_posts.bench': { 'fh_posts.bench._code_block': ('bench.html#_code_block', 'fh_posts/bench.py'),
+                                'fh_posts.bench._paragraph': ('bench.html#_paragraph', 'fh_posts/bench.py'),
+                                'fh_posts.bench.fh_posts_bench': ('bench.html#fh_posts_bench', 'fh_posts/bench.py'),
+                                'fh_posts.bench.format_benchmark': ('bench.html#format_benchmark', 'fh_posts/bench.py'),
+                                'fh_posts.bench.make_markdown_post': ('bench.html#make_markdown_post', 'fh_posts/bench.py'),
+                                'fh_posts.bench.make_notebook_post': ('bench.html#make_notebook_post', 'fh_posts/bench.py'),
+                                'fh_posts.bench.make_posts': ('bench.html#make_posts', 'fh_posts/bench.py'),
+                                'fh_posts.bench.run_benchmark': ('bench.html#run_benchmark', 'fh_posts/bench.py')},
+            'fh_posts.build': { 'fh_posts.build._read_build_manifest': ('build.html#_read_build_manifest', 'fh_posts/build.py'),
+                                'fh_posts.build._render_to_file': ('build.html#_render_to_file', 'fh_posts/build.py'),
+                                'fh_posts.build.build_posts': ('build.html#build_posts', 'fh_posts/build.py'),
+                                'fh_posts.build.fh_posts_build': ('build.html#fh_posts_build', 'fh_posts/build.py'),
+                                'fh_posts.build.read_prerendered': ('build.html#read_prerendered', 'fh_posts/build.py')},
+            'fh_posts.core': { 'fh_posts.core.BlockMemo': ('core.html#blockmemo', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo.__init__': ('core.html#blockmemo.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo.__len__': ('core.html#blockmemo.__len__', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo.__repr__': ('core.html#blockmemo.__repr__', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo._evict': ('core.html#blockmemo._evict', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo.chain_key': ('core.html#blockmemo.chain_key', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo.clear': ('core.html#blockmemo.clear', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo.get': ('core.html#blockmemo.get', 'fh_posts/core.py'),
+                               'fh_posts.core.BlockMemo.set': ('core.html#blockmemo.set', 'fh_posts/core.py'),
+                               'fh_posts.core.Post': ('core.html#post', 'fh_posts/core.py'),
                                'fh_posts.core.Post.__getattr__': ('core.html#post.__getattr__', 'fh_posts/core.py'),
                                'fh_posts.core.Post.__getitem__': ('core.html#post.__getitem__', 'fh_posts/core.py'),
                                'fh_posts.core.Post.__init__': ('core.html#post.__init__', 'fh_posts/core.py'),
                                'fh_posts.core.Post.__repr__': ('core.html#post.__repr__', 'fh_posts/core.py'),
+                               'fh_posts.core.Post._renderer': ('core.html#post._renderer', 'fh_posts/core.py'),
+                               'fh_posts.core.Post._stream': ('core.html#post._stream', 'fh_posts/core.py'),
+                               'fh_posts.core.Post.arender': ('core.html#post.arender', 'fh_posts/core.py'),
+                               'fh_posts.core.Post.etag': ('core.html#post.etag', 'fh_posts/core.py'),
+                               'fh_posts.core.Post.last_modified': ('core.html#post.last_modified', 'fh_posts/core.py'),
                                'fh_posts.core.Post.render': ('core.html#post.render', 'fh_posts/core.py'),
+                               'fh_posts.core.Post.render_stream': ('core.html#post.render_stream', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection': ('core.html#postcollection', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection.__init__': ('core.html#postcollection.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection._indexes': ('core.html#postcollection._indexes', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection.between': ('core.html#postcollection.between', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection.get': ('core.html#postcollection.get', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection.in_month': ('core.html#postcollection.in_month', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection.page': ('core.html#postcollection.page', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection.tagged': ('core.html#postcollection.tagged', 'fh_posts/core.py'),
+                               'fh_posts.core.PostCollection.tags': ('core.html#postcollection.tags', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache': ('core.html#rendercache', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.__init__': ('core.html#rendercache.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.__len__': ('core.html#rendercache.__len__', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.__repr__': ('core.html#rendercache.__repr__', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache._evict': ('core.html#rendercache._evict', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.clear': ('core.html#rendercache.clear', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.content_hash': ('core.html#rendercache.content_hash', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.get': ('core.html#rendercache.get', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.info': ('core.html#rendercache.info', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.key': ('core.html#rendercache.key', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.render': ('core.html#rendercache.render', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderCache.set': ('core.html#rendercache.set', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderMetrics': ('core.html#rendermetrics', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderMetrics.__call__': ('core.html#rendermetrics.__call__', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderMetrics.__init__': ('core.html#rendermetrics.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderMetrics.__repr__': ('core.html#rendermetrics.__repr__', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderMetrics.clear': ('core.html#rendermetrics.clear', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderMetrics.prometheus': ('core.html#rendermetrics.prometheus', 'fh_posts/core.py'),
+                               'fh_posts.core.RenderMetrics.summary': ('core.html#rendermetrics.summary', 'fh_posts/core.py'),
+                               'fh_posts.core.SingleFlight': ('core.html#singleflight', 'fh_posts/core.py'),
+                               'fh_posts.core.SingleFlight.__init__': ('core.html#singleflight.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core.SingleFlight.__repr__': ('core.html#singleflight.__repr__', 'fh_posts/core.py'),
+                               'fh_posts.core.SingleFlight._done': ('core.html#singleflight._done', 'fh_posts/core.py'),
+                               'fh_posts.core.SingleFlight.info': ('core.html#singleflight.info', 'fh_posts/core.py'),
+                               'fh_posts.core.SingleFlight.run': ('core.html#singleflight.run', 'fh_posts/core.py'),
+                               'fh_posts.core._BlockRunner': ('core.html#_blockrunner', 'fh_posts/core.py'),
+                               'fh_posts.core._BlockRunner.__enter__': ('core.html#_blockrunner.__enter__', 'fh_posts/core.py'),
+                               'fh_posts.core._BlockRunner.__exit__': ('core.html#_blockrunner.__exit__', 'fh_posts/core.py'),
+                               'fh_posts.core._BlockRunner.__init__': ('core.html#_blockrunner.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core._BlockRunner._resume': ('core.html#_blockrunner._resume', 'fh_posts/core.py'),
+                               'fh_posts.core._BlockRunner.process': ('core.html#_blockrunner.process', 'fh_posts/core.py'),
+                               'fh_posts.core._CaptureStream': ('core.html#_capturestream', 'fh_posts/core.py'),
+                               'fh_posts.core._CaptureStream.__getattr__': ('core.html#_capturestream.__getattr__', 'fh_posts/core.py'),
+                               'fh_posts.core._CaptureStream.__init__': ('core.html#_capturestream.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core._CaptureStream._target': ('core.html#_capturestream._target', 'fh_posts/core.py'),
+                               'fh_posts.core._CaptureStream.flush': ('core.html#_capturestream.flush', 'fh_posts/core.py'),
+                               'fh_posts.core._CaptureStream.write': ('core.html#_capturestream.write', 'fh_posts/core.py'),
+                               'fh_posts.core._CaptureStream.writelines': ('core.html#_capturestream.writelines', 'fh_posts/core.py'),
+                               'fh_posts.core._JSONScanner': ('core.html#_jsonscanner', 'fh_posts/core.py'),
+                               'fh_posts.core._JSONScanner.__init__': ('core.html#_jsonscanner.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core._JSONScanner._more': ('core.html#_jsonscanner._more', 'fh_posts/core.py'),
+                               'fh_posts.core._JSONScanner.expect': ('core.html#_jsonscanner.expect', 'fh_posts/core.py'),
+                               'fh_posts.core._JSONScanner.peek': ('core.html#_jsonscanner.peek', 'fh_posts/core.py'),
+                               'fh_posts.core._JSONScanner.value': ('core.html#_jsonscanner.value', 'fh_posts/core.py'),
+                               'fh_posts.core._LinkRewriter': ('core.html#_linkrewriter', 'fh_posts/core.py'),
+                               'fh_posts.core._LinkRewriter.__init__': ('core.html#_linkrewriter.__init__', 'fh_posts/core.py'),
+                               'fh_posts.core._LinkRewriter.handle_starttag': ( 'core.html#_linkrewriter.handle_starttag',
+                                                                                'fh_posts/core.py'),
+                               'fh_posts.core._LinkRewriter.rewrite': ('core.html#_linkrewriter.rewrite', 'fh_posts/core.py'),
+                               'fh_posts.core._base_namespace': ('core.html#_base_namespace', 'fh_posts/core.py'),
+                               'fh_posts.core._block_placeholder': ('core.html#_block_placeholder', 'fh_posts/core.py'),
+                               'fh_posts.core._capture_output': ('core.html#_capture_output', 'fh_posts/core.py'),
+                               'fh_posts.core._compile_block': ('core.html#_compile_block', 'fh_posts/core.py'),
+                               'fh_posts.core._decode_cursor': ('core.html#_decode_cursor', 'fh_posts/core.py'),
+                               'fh_posts.core._decode_dates': ('core.html#_decode_dates', 'fh_posts/core.py'),
+                               'fh_posts.core._encode_cursor': ('core.html#_encode_cursor', 'fh_posts/core.py'),
+                               'fh_posts.core._encode_date': ('core.html#_encode_date', 'fh_posts/core.py'),
+                               'fh_posts.core._install_capture': ('core.html#_install_capture', 'fh_posts/core.py'),
+                               'fh_posts.core._invalidates_index': ('core.html#_invalidates_index', 'fh_posts/core.py'),
+                               'fh_posts.core._load_post_file': ('core.html#_load_post_file', 'fh_posts/core.py'),
+                               'fh_posts.core._load_posts': ('core.html#_load_posts', 'fh_posts/core.py'),
+                               'fh_posts.core._manifest_entry': ('core.html#_manifest_entry', 'fh_posts/core.py'),
+                               'fh_posts.core._mimebundle_to_html': ('core.html#_mimebundle_to_html', 'fh_posts/core.py'),
+                               'fh_posts.core._open_links_in_new_window': ('core.html#_open_links_in_new_window', 'fh_posts/core.py'),
+                               'fh_posts.core._phase': ('core.html#_phase', 'fh_posts/core.py'),
+                               'fh_posts.core._placeholder_re': ('core.html#_placeholder_re', 'fh_posts/core.py'),
+                               'fh_posts.core._post_tags': ('core.html#_post_tags', 'fh_posts/core.py'),
+                               'fh_posts.core._read_first_notebook_cell': ('core.html#_read_first_notebook_cell', 'fh_posts/core.py'),
+                               'fh_posts.core._read_frontmatter_block': ('core.html#_read_frontmatter_block', 'fh_posts/core.py'),
+                               'fh_posts.core._read_manifest': ('core.html#_read_manifest', 'fh_posts/core.py'),
+                               'fh_posts.core._restore_namespace': ('core.html#_restore_namespace', 'fh_posts/core.py'),
+                               'fh_posts.core._shallow_size': ('core.html#_shallow_size', 'fh_posts/core.py'),
+                               'fh_posts.core._snapshot_namespace': ('core.html#_snapshot_namespace', 'fh_posts/core.py'),
+                               'fh_posts.core._sort_key': ('core.html#_sort_key', 'fh_posts/core.py'),
+                               'fh_posts.core._split_fenced_blocks': ('core.html#_split_fenced_blocks', 'fh_posts/core.py'),
+                               'fh_posts.core._store_key': ('core.html#_store_key', 'fh_posts/core.py'),
+                               'fh_posts.core._try_load_post_file': ('core.html#_try_load_post_file', 'fh_posts/core.py'),
+                               'fh_posts.core._without_last_expr': ('core.html#_without_last_expr', 'fh_posts/core.py'),
+                               'fh_posts.core._write_atomic': ('core.html#_write_atomic', 'fh_posts/core.py'),
+                               'fh_posts.core._write_manifest': ('core.html#_write_manifest', 'fh_posts/core.py'),
+                               'fh_posts.core.add_phase_hook': ('core.html#add_phase_hook', 'fh_posts/core.py'),
+                               'fh_posts.core.aload_posts': ('core.html#aload_posts', 'fh_posts/core.py'),
                                'fh_posts.core.execute_code': ('core.html#execute_code', 'fh_posts/core.py'),
                                'fh_posts.core.extract_frontmatter': ('core.html#extract_frontmatter', 'fh_posts/core.py'),
                                'fh_posts.core.extract_notebook_frontmatter': ('core.html#extract_notebook_frontmatter', 'fh_posts/core.py'),
+                               'fh_posts.core.file_hash': ('core.html#file_hash', 'fh_posts/core.py'),
                                'fh_posts.core.get_post_date': ('core.html#get_post_date', 'fh_posts/core.py'),
+                               'fh_posts.core.iter_markdown_post': ('core.html#iter_markdown_post', 'fh_posts/core.py'),
+                               'fh_posts.core.iter_notebook_post': ('core.html#iter_notebook_post', 'fh_posts/core.py'),
+                               'fh_posts.core.load_post': ('core.html#load_post', 'fh_posts/core.py'),
                                'fh_posts.core.load_posts': ('core.html#load_posts', 'fh_posts/core.py'),
+                               'fh_posts.core.new_namespace': ('core.html#new_namespace', 'fh_posts/core.py'),
+                               'fh_posts.core.outputs_to_html': ('core.html#outputs_to_html', 'fh_posts/core.py'),
+                               'fh_posts.core.parse_date': ('core.html#parse_date', 'fh_posts/core.py'),
                                'fh_posts.core.parse_tag': ('core.html#parse_tag', 'fh_posts/core.py'),
                                'fh_posts.core.process_code_block': ('core.html#process_code_block', 'fh_posts/core.py'),
+                               'fh_posts.core.record_phases': ('core.html#record_phases', 'fh_posts/core.py'),
+                               'fh_posts.core.remove_phase_hook': ('core.html#remove_phase_hook', 'fh_posts/core.py'),
                                'fh_posts.core.render_markdown_post': ('core.html#render_markdown_post', 'fh_posts/core.py'),
-                               'fh_posts.core.render_notebook_post': ('core.html#render_notebook_post', 'fh_posts/core.py')}}}
+                               'fh_posts.core.render_notebook_post': ('core.html#render_notebook_post', 'fh_posts/core.py')},
+            'fh_posts.pool': { 'fh_posts.pool.ProcessExecutor': ('pool.html#processexecutor', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor.__enter__': ('pool.html#processexecutor.__enter__', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor.__exit__': ('pool.html#processexecutor.__exit__', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor.__init__': ('pool.html#processexecutor.__init__', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor.__repr__': ('pool.html#processexecutor.__repr__', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor._checkin': ('pool.html#processexecutor._checkin', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor._checkout': ('pool.html#processexecutor._checkout', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor._replace': ('pool.html#processexecutor._replace', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor._run': ('pool.html#processexecutor._run', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor._start_worker': ( 'pool.html#processexecutor._start_worker',
+                                                                                'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor.close': ('pool.html#processexecutor.close', 'fh_posts/pool.py'),
+                               'fh_posts.pool.ProcessExecutor.runner': ('pool.html#processexecutor.runner', 'fh_posts/pool.py'),
+                               'fh_posts.pool._PoolRunner': ('pool.html#_poolrunner', 'fh_posts/pool.py'),
+                               'fh_posts.pool._PoolRunner.__enter__': ('pool.html#_poolrunner.__enter__', 'fh_posts/pool.py'),
+                               'fh_posts.pool._PoolRunner.__exit__': ('pool.html#_poolrunner.__exit__', 'fh_posts/pool.py'),
+                               'fh_posts.pool._PoolRunner.__init__': ('pool.html#_poolrunner.__init__', 'fh_posts/pool.py'),
+                               'fh_posts.pool._PoolRunner.process': ('pool.html#_poolrunner.process', 'fh_posts/pool.py'),
+                               'fh_posts.pool._Worker': ('pool.html#_worker', 'fh_posts/pool.py'),
+                               'fh_posts.pool._Worker.__init__': ('pool.html#_worker.__init__', 'fh_posts/pool.py'),
+                               'fh_posts.pool._Worker.kill': ('pool.html#_worker.kill', 'fh_posts/pool.py'),
+                               'fh_posts.pool._Worker.stop': ('pool.html#_worker.stop', 'fh_posts/pool.py'),
+                               'fh_posts.pool._Worker.wait_ready': ('pool.html#_worker.wait_ready', 'fh_posts/pool.py'),
+                               'fh_posts.pool._rss_mb': ('pool.html#_rss_mb', 'fh_posts/pool.py'),
+                               'fh_posts.pool._worker_main': ('pool.html#_worker_main', 'fh_posts/pool.py')},
+            'fh_posts.search': { 'fh_posts.search.SearchIndex': ('search.html#searchindex', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex.__init__': ('search.html#searchindex.__init__', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex.__len__': ('search.html#searchindex.__len__', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex.__repr__': ('search.html#searchindex.__repr__', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex._add': ('search.html#searchindex._add', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex._load': ('search.html#searchindex._load', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex._remove': ('search.html#searchindex._remove', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex.refresh': ('search.html#searchindex.refresh', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex.save': ('search.html#searchindex.save', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex.search': ('search.html#searchindex.search', 'fh_posts/search.py'),
+                                 'fh_posts.search.SearchIndex.update': ('search.html#searchindex.update', 'fh_posts/search.py'),
+                                 'fh_posts.search.post_text': ('search.html#post_text', 'fh_posts/search.py'),
+                                 'fh_posts.search.tokenize': ('search.html#tokenize', 'fh_posts/search.py')},
+            'fh_posts.serve': { 'fh_posts.serve._etag_matches': ('serve.html#_etag_matches', 'fh_posts/serve.py'),
+                                'fh_posts.serve.not_modified': ('serve.html#not_modified', 'fh_posts/serve.py'),
+                                'fh_posts.serve.post_response': ('serve.html#post_response', 'fh_posts/serve.py')},
+            'fh_posts.store': { 'fh_posts.store.SqliteRenderStore': ('store.html#sqliterenderstore', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.__contains__': ( 'store.html#sqliterenderstore.__contains__',
+                                                                                   'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.__getstate__': ( 'store.html#sqliterenderstore.__getstate__',
+                                                                                   'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.__init__': ('store.html#sqliterenderstore.__init__', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.__len__': ('store.html#sqliterenderstore.__len__', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.__repr__': ('store.html#sqliterenderstore.__repr__', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.__setstate__': ( 'store.html#sqliterenderstore.__setstate__',
+                                                                                   'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore._connect': ('store.html#sqliterenderstore._connect', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.clear': ('store.html#sqliterenderstore.clear', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.delete': ('store.html#sqliterenderstore.delete', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.delete_prefix': ( 'store.html#sqliterenderstore.delete_prefix',
+                                                                                    'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.get': ('store.html#sqliterenderstore.get', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.prune': ('store.html#sqliterenderstore.prune', 'fh_posts/store.py'),
+                                'fh_posts.store.SqliteRenderStore.set': ('store.html#sqliterenderstore.set', 'fh_posts/store.py')},
+            'fh_posts.watch': { 'fh_posts.watch.PostIndex': ('watch.html#postindex', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__contains__': ('watch.html#postindex.__contains__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__enter__': ('watch.html#postindex.__enter__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__exit__': ('watch.html#postindex.__exit__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__getitem__': ('watch.html#postindex.__getitem__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__init__': ('watch.html#postindex.__init__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__iter__': ('watch.html#postindex.__iter__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__len__': ('watch.html#postindex.__len__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.__repr__': ('watch.html#postindex.__repr__', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex._insert': ('watch.html#postindex._insert', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex._remove': ('watch.html#postindex._remove', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex._scan': ('watch.html#postindex._scan', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex._sort_key': ('watch.html#postindex._sort_key', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex._watch': ('watch.html#postindex._watch', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.get': ('watch.html#postindex.get', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.posts': ('watch.html#postindex.posts', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.refresh': ('watch.html#postindex.refresh', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.start': ('watch.html#postindex.start', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.stop': ('watch.html#postindex.stop', 'fh_posts/watch.py'),
+                                'fh_posts.watch.PostIndex.update': ('watch.html#postindex.update', 'fh_posts/watch.py'),
+                                'fh_posts.watch._Inotify': ('watch.html#_inotify', 'fh_posts/watch.py'),
+                                'fh_posts.watch._Inotify.__init__': ('watch.html#_inotify.__init__', 'fh_posts/watch.py'),
+                                'fh_posts.watch._Inotify.close': ('watch.html#_inotify.close', 'fh_posts/watch.py'),
+                                'fh_posts.watch._Inotify.read': ('watch.html#_inotify.read', 'fh_posts/watch.py'),
+                                'fh_posts.watch._inotify_available': ('watch.html#_inotify_available', 'fh_posts/watch.py')}}}
@@ -1 +1,8 @@
-from .core import *
\ No newline at end of file
+from .core import *
+from .store import *
+from .watch import *
+from .pool import *
+from .search import *
+from .build import *
+from .serve import *
+from .bench import *
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""Generate synthetic posts and time loading and rendering them, phase by phase."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/07_bench.ipynb.
+
+# %% auto 0
+__all__ = ['make_markdown_post', 'make_notebook_post', 'make_posts', 'run_benchmark', 'format_benchmark', 'fh_posts_bench']
+
+# %% ../nbs/07_bench.ipynb 3
+from pathlib import Path
+import json
+import random
+import tempfile
+import shutil
+import time
+from typing import Dict, List, Optional
+from fastcore.script import call_parse, Param, store_true
+from fastcore.test import *
+from .core import load_posts, record_phases
+
+# %% ../nbs/07_bench.ipynb 5
+_WORDS = ('post render fasthtml markdown notebook block code output cache phase index page route link '
+          'table value number result server client time query cell yaml metadata slug title').split()
+
+def _paragraph(rng: random.Random, words: int, i: int) -> str:
+    text = ' '.join(rng.choice(_WORDS) for _ in range(words))
+    return f"{text.capitalize()} with a [link](https://example.com/{i}), some *emphasis* and `inline code`."
+
+def _code_block(i: int, loop_size: int, seed: int) -> str:
+    return (f"values_{i} = [j * j for j in range({loop_size})]\n"
+            f"print('post {seed} block {i}:', sum(values_{i}))\n"
+            f"Div(P('Block {i}'), Ul(*[Li(v) for v in values_{i}[:5]]), cls='box')")
+
+# %% ../nbs/07_bench.ipynb 6
+def make_markdown_post(
+        path: str|Path, # The `.md` file to write
+        paragraphs: int = 10, # The number of markdown paragraphs
+        code_blocks: int = 5, # The number of Python code blocks, spread between the paragraphs
+        words: int = 60, # The number of words in each paragraph
+        loop_size: int = 1000, # The size of the loop in each code block
+        seed: int = 0 # The seed of the random text
+        ) -> Path:
+    """Write a markdown post with frontmatter, `paragraphs` paragraphs of random text and `code_blocks` running code blocks."""
+    rng = random.Random(seed)
+    path = Path(path)
+    parts = [f"---\ntitle: Synthetic {path.stem}\ndate: January {seed % 28 + 1:02d}, 2025\n"
+             f"summary: A synthetic post\ntags: [{rng.choice(_WORDS)}, {rng.choice(_WORDS)}]\n---\n"]
+    for i in range(max(paragraphs, code_blocks)):
+        if i < paragraphs:
+            parts.append(_paragraph(rng, words, i))
+        if i < code_blocks:
+            parts.append(f"```python:run\n{_code_block(i, loop_size, seed)}\n```")
+    path.write_text('\n\n'.join(parts) + '\n', encoding='utf-8')
+    return path
+
+# %% ../nbs/07_bench.ipynb 7
+def make_notebook_post(
+        path: str|Path, # The `.ipynb` file to write
+        paragraphs: int = 10, # The number of markdown cells
+        code_blocks: int = 5, # The number of code cells, spread between the markdown cells
+        words: int = 60, # The number of words in each markdown cell
+        loop_size: int = 1000, # The size of the loop in each code cell
+        seed: int = 0 # The seed of the random text
+        ) -> Path:
+    """Write a notebook post with a frontmatter cell, `paragraphs` markdown cells and `code_blocks` running code cells."""
+    rng = random.Random(seed)
+    path = Path(path)
+    def cell(cell_type, source):
+        return {'cell_type': cell_type, 'metadata': {}, 'source': source,
+                **({'execution_count': None, 'outputs': []} if cell_type == 'code' else {})}
+    cells = [cell('raw', f"---\ntitle: Synthetic {path.stem}\ndate: January {seed % 28 + 1:02d}, 2025\n---")]
+    for i in range(max(paragraphs, code_blocks)):
+        if i < paragraphs:
+            cells.append(cell('markdown', _paragraph(rng, words, i)))
+        if i < code_blocks:
+            cells.append(cell('code', f"#|python:run\n{_code_block(i, loop_size, seed)}"))
+    notebook = {'cells': cells, 'metadata': {}, 'nbformat': 4, 'nbformat_minor': 4}
+    path.write_text(json.dumps(notebook, indent=1), encoding='utf-8')
+    return path
+
+# %% ../nbs/07_bench.ipynb 8
+def make_posts(
+        path: str|Path, # The directory to write the posts to
+        posts: int = 20, # The number of posts, alternating between markdown and notebooks if `kind` is `both`
+        kind: str = 'both', # `md`, `ipynb` or `both`
+        seed: int = 0, # The seed of the first post, each post gets the next one
+        **sizes # Passed to `make_markdown_post` and `make_notebook_post`, e.g. `code_blocks`
+        ) -> List[Path]:
+    """Write `posts` synthetic posts to `path`."""
+    if kind not in ('md', 'ipynb', 'both'):
+        raise ValueError(f"Unknown kind of post: {kind}")
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(posts):
+        suffix = kind if kind != 'both' else ('md', 'ipynb')[i % 2]
+        make = make_markdown_post if suffix == 'md' else make_notebook_post
+        paths.append(make(path/f'post_{i:04d}.{suffix}', seed=seed + i, **sizes))
+    return paths
+
+# %% ../nbs/07_bench.ipynb 11
+def run_benchmark(
+        posts: int = 20, # The number of synthetic posts
+        kind: str = 'both', # `md`, `ipynb` or `both`
+        repeat: int = 3, # The number of times to load and render every post, the fastest run is reported
+        path: Optional[str|Path] = None, # The directory to write the posts to, a temporary directory by default
+        seed: int = 0, # The seed of the first post
+        open_links_new_window: bool = True, # Whether the renders rewrite links
+        **sizes # Passed to `make_posts`, e.g. `code_blocks` or `paragraphs`
+        ) -> Dict: # Seconds for `load_posts` and all renders, and the totals of each phase of the fastest run
+    """Generate synthetic posts and time loading them with `load_posts` and rendering each one without the render
+    cache, so every code block runs. Returns the fastest of `repeat` runs with its phase totals."""
+    tmp_dir = Path(tempfile.mkdtemp()) if path is None else None
+    posts_dir = tmp_dir or Path(path)
+    try:
+        make_posts(posts_dir, posts, kind, seed, **sizes)
+        best = None
+        for _ in range(repeat):
+            with record_phases() as metrics:
+                start = time.perf_counter()
+                loaded = load_posts(posts_dir)
+                load_s = time.perf_counter() - start
+                start = time.perf_counter()
+                for post in loaded:
+                    post.render(open_links_new_window=open_links_new_window, cache=False)
+                render_s = time.perf_counter() - start
+            if best is None or load_s + render_s < best['load_s'] + best['render_s']:
+                best = {'posts': len(loaded), 'load_s': load_s, 'render_s': render_s, 'phases': metrics.summary()}
+        return best
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir)
+
+# %% ../nbs/07_bench.ipynb 12
+def format_benchmark(
+        result: Dict # The result of `run_benchmark`
+        ) -> str:
+    """Format a benchmark result as a table of phases, with the time and bytes per post."""
+    n = result['posts']
+    lines = [f"{n} posts: load_posts {result['load_s'] * 1000:.1f}ms, render {result['render_s'] * 1000:.1f}ms "
+             f"({result['render_s'] * 1000 / max(n, 1):.2f}ms per post)",
+             f"{'phase':<12}{'calls':>8}{'ms/post':>10}{'KB/post':>10}"]
+    for phase, t in sorted(result['phases'].items(), key=lambda item: -item[1]['seconds']):
+        lines.append(f"{phase:<12}{t['count']:>8}{t['seconds'] * 1000 / max(n, 1):>10.3f}{t['bytes'] / 1024 / max(n, 1):>10.1f}")
+    return '\n'.join(lines)
+
+# %% ../nbs/07_bench.ipynb 17
+@call_parse
+def fh_posts_bench(
+        posts: Param("Number of synthetic posts", int) = 20,
+        kind: Param("Kind of posts", str, choices=['md', 'ipynb', 'both']) = 'both',
+        paragraphs: Param("Markdown paragraphs per post", int) = 10,
+        code_blocks: Param("Code blocks per post", int) = 5,
+        words: Param("Words per paragraph", int) = 60,
+        loop_size: Param("Size of the loop in each code block", int) = 1000,
+        repeat: Param("Number of runs, the fastest is reported", int) = 3,
+        seed: Param("Seed of the generated text", int) = 0,
+        as_json: Param("Print the result as JSON", store_true) = False
+        ):
+    "Time loading and rendering synthetic posts, phase by phase."
+    result = run_benchmark(posts, kind, repeat, seed=seed, paragraphs=paragraphs, code_blocks=code_blocks,
+                           words=words, loop_size=loop_size)
+    print(json.dumps(result, indent=2) if as_json else format_benchmark(result))
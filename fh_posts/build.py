@@ -0,0 +1,140 @@
+"""Pre-render every post to an HTML file so they can be served without running any code."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_build.ipynb.
+
+# %% auto 0
+__all__ = ['build_posts', 'read_prerendered', 'fh_posts_build']
+
+# %% ../nbs/05_build.ipynb 3
+from pathlib import Path
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from fastcore.script import call_parse, Param, store_true
+from fastcore.test import *
+from fasthtml.common import NotStr
+from . import __version__
+from .core import load_posts, file_hash, logger, _write_atomic
+
+# %% ../nbs/05_build.ipynb 5
+_BUILD_MANIFEST_NAME = '.fh_posts_build.json'
+_BUILD_MANIFEST_VERSION = 1
+
+def _read_build_manifest(manifest_path: Path, options: Dict) -> Dict:
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Outputs rendered with other options or another version of the renderer are stale
+    if manifest.get('version') != _BUILD_MANIFEST_VERSION or manifest.get('options') != options:
+        return {}
+    return manifest.get('posts', {})
+
+def _render_to_file(args: tuple) -> Optional[str]:
+    # Render one post and write it out, returning the error instead of raising so it can be reported
+    post, out_path, options, memo = args
+    try:
+        _write_atomic(out_path, str(post.render(cache=False, memo=memo, **options)))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+# %% ../nbs/05_build.ipynb 6
+def build_posts(
+        path: str|Path, # The path to the directory containing the posts
+        out_dir: str|Path, # The directory to write `<slug>.html` files and the build manifest to
+        date_format: str = "%B %d, %Y", # The format string for the date i.e. "January 01, 2025"
+        workers: Optional[int] = None, # Number of worker processes, `None` for one per CPU and `1` to render in this process
+        open_links_new_window: bool = False, # Whether to open links in a new window
+        live_label: bool = True, # Whether to show the live label
+        use_stored_outputs: bool = False, # Show the outputs saved in notebooks instead of executing their cells
+        force: bool = False, # Render every post, even if it is unchanged since the last build
+        memo: bool = False # Reuse unchanged code blocks from the rendering process's `block_memo`, e.g. across builds with `workers=1`
+        ) -> Dict[str, List[str]]: # The slugs that were `rendered`, `unchanged`, `removed` or `failed`
+    """Pre-render the posts in `path` to HTML files in `out_dir`, only rendering posts whose content changed."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir/_BUILD_MANIFEST_NAME
+    options = {'open_links_new_window': open_links_new_window, 'live_label': live_label, 'use_stored_outputs': use_stored_outputs}
+    build_options = {**options, 'fh_posts': __version__}
+    old = {} if force else _read_build_manifest(manifest_path, build_options)
+
+    result = {'rendered': [], 'unchanged': [], 'removed': [], 'failed': []}
+    entries, jobs, slugs = {}, [], set()
+    for post in load_posts(path, date_format):
+        name = post.path.name
+        if post.slug in slugs:
+            logger.warning(f"Skipping {post.path}: another post has the slug '{post.slug}'")
+            continue
+        slugs.add(post.slug)
+        st = post.path.stat()
+        entry = old.get(name)
+        # Only hash files whose size or mtime changed
+        if entry and entry['slug'] == post.slug and [st.st_size, st.st_mtime_ns] == entry['stat']:
+            content_hash = entry['hash']
+        else:
+            content_hash = file_hash(post.path)
+        entries[name] = {'slug': post.slug, 'hash': content_hash, 'stat': [st.st_size, st.st_mtime_ns]}
+        out_path = out_dir/f'{post.slug}.html'
+        if entry and entry['slug'] == post.slug and entry['hash'] == content_hash and out_path.exists():
+            result['unchanged'].append(post.slug)
+        else:
+            jobs.append((post, out_path, options, memo))
+
+    executor = ProcessPoolExecutor(workers) if workers != 1 and len(jobs) > 1 else None
+    try:
+        errors = executor.map(_render_to_file, jobs) if executor else map(_render_to_file, jobs)
+        for (post, *_), error in zip(jobs, errors):
+            if error is None:
+                result['rendered'].append(post.slug)
+            else:
+                logger.error(f"Error rendering {post.path}: {error}")
+                result['failed'].append(post.slug)
+                # Keep serving the last good output, if any, and render it again next time since its hash is stale
+                if post.path.name in old:
+                    entries[post.path.name] = old[post.path.name]
+                else:
+                    del entries[post.path.name]
+    finally:
+        if executor:
+            executor.shutdown()
+
+    live_slugs = {entry['slug'] for entry in entries.values()}
+    for name, entry in old.items():
+        if entry['slug'] not in live_slugs:
+            (out_dir/f"{entry['slug']}.html").unlink(missing_ok=True)
+            result['removed'].append(entry['slug'])
+
+    _write_atomic(manifest_path, json.dumps({'version': _BUILD_MANIFEST_VERSION, 'options': build_options, 'posts': entries}))
+    return result
+
+# %% ../nbs/05_build.ipynb 7
+def read_prerendered(
+        out_dir: str|Path, # The output directory of `build_posts`
+        slug: str # The slug of the post
+        ) -> Optional[NotStr]:
+    """Return the pre-rendered HTML of the post with `slug`, or `None` if it wasn't built."""
+    try:
+        return NotStr((Path(out_dir)/f'{Path(slug).name}.html').read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+
+# %% ../nbs/05_build.ipynb 13
+@call_parse
+def fh_posts_build(
+        path: Param("Directory containing the posts", str),
+        out_dir: Param("Directory to write the rendered HTML to", str),
+        date_format: Param("Format string for post dates", str) = "%B %d, %Y",
+        workers: Param("Number of worker processes, default one per CPU", int) = None,
+        open_links_new_window: Param("Open links in a new window", store_true) = False,
+        no_live_label: Param("Don't show the live label under code output", store_true) = False,
+        use_stored_outputs: Param("Show the outputs saved in notebooks instead of executing their cells", store_true) = False,
+        force: Param("Render every post, even if it is unchanged", store_true) = False
+        ):
+    "Pre-render the posts in `path` to HTML files in `out_dir`."
+    result = build_posts(path, out_dir, date_format, workers=workers, open_links_new_window=open_links_new_window,
+                         live_label=not no_live_label, use_stored_outputs=use_stored_outputs, force=force)
+    print(', '.join(f"{len(slugs)} {name}" for name, slugs in result.items()))
+    if result['failed']:
+        raise SystemExit(1)
@@ -3,8 +3,12 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_core.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'Post', 'extract_frontmatter', 'extract_notebook_frontmatter', 'get_post_date', 'load_posts', 'parse_tag',
-           'execute_code', 'process_code_block', 'render_markdown_post', 'render_notebook_post']
+__all__ = ['logger', 'render_cache', 'render_flights', 'DATE_FORMATS', 'block_memo', 'file_hash', 'RenderCache', 'SingleFlight',
+           'add_phase_hook', 'remove_phase_hook', 'RenderMetrics', 'record_phases', 'Post', 'extract_frontmatter',
+           'extract_notebook_frontmatter', 'parse_date', 'get_post_date', 'PostCollection', 'load_post', 'load_posts',
+           'aload_posts', 'parse_tag', 'new_namespace', 'execute_code', 'process_code_block', 'BlockMemo',
+           'iter_markdown_post', 'render_markdown_post', 'outputs_to_html', 'iter_notebook_post',
+           'render_notebook_post']
 
 # %% ../nbs/00_core.ipynb 3
 from pathlib import Path
@@ -14,13 +18,33 @@ from fasthtml.common import to_xml, NotStr
 from monsterui.all import *
 import nbformat
 import re
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
 import io
 import sys
-from typing import List, Dict, Optional
+import ast
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import logging
+import datetime as dt
 from datetime import datetime
 from fastcore.test import *
+from . import __version__
+import hashlib
+import base64
+import bisect
+import os
+import threading
+import contextvars
+import time
+from contextlib import contextmanager
+import collections
+from collections import OrderedDict
+import json
+import html
+import pickle
+import types
+import asyncio
+from functools import lru_cache, partial
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 # %% ../nbs/00_core.ipynb 4
 # Set up logging
@@ -28,9 +52,324 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("fh-posts")
 
 # %% ../nbs/00_core.ipynb 6
+def file_hash(
+        file_path: Path # The path to the file to hash
+        ) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+# %% ../nbs/00_core.ipynb 7
+def _store_key(key: tuple) -> str:
+    # Persistent stores are keyed by strings, e.g. '["<sha256>", ["live_label", true], ..., ["fh_posts", "0.0.1"]]'.
+    # The library version is included so renders from before an upgrade aren't served after it
+    return json.dumps(key + (('fh_posts', __version__),))
+
+# %% ../nbs/00_core.ipynb 8
+class RenderCache:
+    """An in-memory LRU cache of rendered post HTML keyed by the content hash of the post's file and the
+    render options. A file is only re-hashed when its size or mtime changes, so a hit costs a `stat` call
+    and a dictionary lookup. An optional persistent `store` such as `SqliteRenderStore` backs the memory
+    cache so renders are shared across processes and survive restarts."""
+    def __init__(
+            self, # The cache to initialize
+            maxsize: int = 256, # The maximum number of rendered posts to keep
+            max_bytes: Optional[int] = 64 * 1024 * 1024, # The maximum memory used by cached HTML, `None` for no limit
+            store = None # Optional persistent store with `get` and `set` methods taking string keys
+            ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.store = store
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> rendered HTML, least recently used first
+        self._hashes = {}  # path -> ((size, mtime_ns), content hash)
+        self._lock = threading.RLock()
+
+    def content_hash(
+            self, # The cache
+            path: Path # The path to the post's file
+            ) -> str:
+        """Return the content hash of `path`, re-hashing only if the file changed on disk."""
+        path = Path(path)
+        st = os.stat(path)
+        sig = (st.st_size, st.st_mtime_ns)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == sig:
+            return cached[1]
+
+        digest = file_hash(path)
+        with self._lock:
+            self._hashes[path] = (sig, digest)
+            # Drop renders of the previous version of the file
+            if cached and cached[1] != digest:
+                for key in [k for k in self._entries if k[0] == cached[1]]:
+                    self._evict(key)
+        if cached and cached[1] != digest and hasattr(self.store, 'delete_prefix'):
+            # Stored keys start with the content hash, e.g. '["<sha256>", ...', whatever the version
+            self.store.delete_prefix(json.dumps([cached[1]])[:-1])
+        return digest
+
+    def key(
+            self, # The cache
+            post: 'Post', # The post being rendered
+            **options # The render options
+            ) -> tuple:
+        """Build the cache key for `post` rendered with `options`."""
+        return (self.content_hash(post.path),) + tuple(sorted(options.items()))
+
+    def get(self, key: tuple) -> Optional[str]:
+        """Return the cached HTML for `key` or `None`, falling back to the persistent store on a memory miss."""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+
+        html = self.store.get(_store_key(key)) if self.store is not None else None
+        with self._lock:
+            if html is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.store_hits += 1
+        self.set(key, html, persist=False)
+        return html
+
+    def set(
+            self, # The cache
+            key: tuple, # The cache key from `RenderCache.key`
+            html: str, # The rendered HTML
+            persist: bool = True # Whether to also write the HTML to the persistent store
+            ):
+        """Store `html` under `key`, evicting least recently used entries to stay within the bounds."""
+        html = str(html)
+        if persist and self.store is not None:
+            self.store.set(_store_key(key), html)
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = html
+            self.nbytes += sys.getsizeof(html)
+            while self._entries and (len(self._entries) > self.maxsize or
+                                     (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                self._evict(next(iter(self._entries)))
+
+    def _evict(self, key):
+        self.nbytes -= sys.getsizeof(self._entries.pop(key))
+
+    def render(
+            self, # The cache
+            post: 'Post', # The post to render
+            render_fn, # The render function to call on a miss, e.g. `render_markdown_post`
+            **options # The render options passed to `render_fn`
+            ) -> NotStr:
+        """Return the cached render of `post`, calling `render_fn` on a miss."""
+        key = self.key(post, **options)
+        html = self.get(key)
+        if html is None:
+            html = str(render_fn(post, **options))
+            self.set(key, html)
+        return NotStr(html)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hashes.clear()
+            self.hits = self.store_hits = self.misses = self.nbytes = 0
+
+    def info(self) -> Dict:
+        """Return the cache statistics."""
+        with self._lock:
+            return {'hits': self.hits, 'store_hits': self.store_hits, 'misses': self.misses,
+                    'entries': len(self._entries), 'nbytes': self.nbytes,
+                    'maxsize': self.maxsize, 'max_bytes': self.max_bytes}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"RenderCache(entries={len(self)}, hits={self.hits}, misses={self.misses})"
+
+# %% ../nbs/00_core.ipynb 9
+# Shared cache used by `Post.render`
+render_cache = RenderCache()
+
+# %% ../nbs/00_core.ipynb 11
+class SingleFlight:
+    """Run calls in an executor so that concurrent callers awaiting the same key share one in-flight call.
+    `started` counts the calls that were run and `coalesced` the callers that joined one already in flight.
+    Calls are only shared within an event loop, so one group can be used by several loops in different threads."""
+    def __init__(self):
+        self._inflight = {}  # (event loop, key) -> future
+        self._lock = threading.Lock()
+        self.started = self.coalesced = 0
+
+    async def run(
+            self, # The single-flight group
+            key, # A hashable key, callers with equal keys share a call
+            fn, # The function to call
+            *args, # Arguments for `fn`
+            executor: Optional[Executor] = None # The executor to call `fn` in, `None` for the event loop's default
+            ):
+        """Return the result of `fn(*args)`, joining a call with the same `key` if one is in flight."""
+        loop = asyncio.get_running_loop()
+        # A future can only be awaited from its own loop
+        flight = (loop, key)
+        with self._lock:
+            future = self._inflight.get(flight)
+            if future is None:
+                future = loop.run_in_executor(executor, fn, *args)
+                self._inflight[flight] = future
+                future.add_done_callback(partial(self._done, flight))
+                self.started += 1
+            else:
+                self.coalesced += 1
+        # Shield the shared call so a caller that is cancelled doesn't cancel it for the others
+        return await asyncio.shield(future)
+
+    def _done(self, flight: tuple, future: asyncio.Future):
+        with self._lock:
+            if self._inflight.get(flight) is future:
+                del self._inflight[flight]
+
+    def info(self) -> Dict:
+        """Return the call counters."""
+        return {'started': self.started, 'coalesced': self.coalesced, 'in_flight': len(self._inflight)}
+
+    def __repr__(self):
+        return f"SingleFlight(started={self.started}, coalesced={self.coalesced}, in_flight={len(self._inflight)})"
+
+# %% ../nbs/00_core.ipynb 12
+# Shared by `Post.arender` and `aload_posts`
+render_flights = SingleFlight()
+
+# %% ../nbs/00_core.ipynb 16
+_phase_hooks = ()  # Replaced rather than changed, so phases can read it without a lock
+_phase_hooks_lock = threading.Lock()
+
+def add_phase_hook(
+        hook # Called as `hook(phase, seconds, info)` at the end of each render phase, in the thread that ran it
+        ):
+    """Start calling `hook` for the render phases of every thread."""
+    global _phase_hooks
+    with _phase_hooks_lock:
+        _phase_hooks = (*_phase_hooks, hook)
+
+def remove_phase_hook(hook):
+    """Stop calling `hook`."""
+    global _phase_hooks
+    with _phase_hooks_lock:
+        hooks = list(_phase_hooks)
+        hooks.remove(hook)
+        _phase_hooks = tuple(hooks)
+
+@contextmanager
+def _phase(
+        name: str, # The name of the phase
+        **info # Details passed to the hooks, e.g. the post's `path`
+        ):
+    """Time the enclosed phase for the phase hooks. The phase can add details to the yielded dict, and set `data` to the
+    text or bytes it read or produced to report their size in UTF-8 as `bytes`, measured only if a hook is registered.
+    A phase that counts its own bytes sets `bytes` instead, checking first that the dict isn't empty."""
+    hooks = _phase_hooks
+    if not hooks:
+        yield {}
+        return
+    start = time.perf_counter()
+    try:
+        yield info
+    finally:
+        seconds = time.perf_counter() - start
+        data = info.pop('data', None)
+        if data is not None:
+            info['bytes'] = len(data) if isinstance(data, bytes) else len(str(data).encode())
+        for hook in hooks:
+            try:
+                hook(name, seconds, info)
+            except Exception as e:
+                logger.warning(f"Phase hook {hook!r} failed: {e}")
+
+# %% ../nbs/00_core.ipynb 17
+class RenderMetrics:
+    """A phase hook that totals the calls, seconds and bytes of each render phase and keeps the latest `max_events`
+    events, e.g. to time the blocks of one post. Use it with `record_phases`, or `add_phase_hook` for a server."""
+    def __init__(
+            self, # The metrics to initialize
+            max_events: Optional[int] = 10_000 # The number of events to keep, `None` for all of them
+            ):
+        self.events = collections.deque(maxlen=max_events)  # (phase, seconds, info) in the order the phases finished
+        self.totals = {}  # Phase -> {'count', 'seconds', 'bytes'}
+        self._lock = threading.Lock()
+
+    def __call__(self, phase: str, seconds: float, info: Dict):
+        with self._lock:
+            self.events.append((phase, seconds, info))
+            totals = self.totals.get(phase)
+            if totals is None:
+                totals = self.totals[phase] = {'count': 0, 'seconds': 0.0, 'bytes': 0}
+            totals['count'] += 1
+            totals['seconds'] += seconds
+            totals['bytes'] += info.get('bytes', 0)
+
+    def summary(self) -> Dict[str, Dict]:
+        """Return a copy of the totals of each phase."""
+        with self._lock:
+            return {phase: dict(totals) for phase, totals in self.totals.items()}
+
+    def prometheus(
+            self, # The metrics
+            prefix: str = 'fh_posts' # The prefix of the metric names
+            ) -> str: # The totals in the Prometheus text exposition format
+        """Format the totals of each phase as Prometheus metrics, e.g. to serve from a `/metrics` route."""
+        totals = self.summary()
+        lines = [f'# HELP {prefix}_phase_seconds Time spent in each render phase.',
+                 f'# TYPE {prefix}_phase_seconds summary']
+        for phase, t in totals.items():
+            lines.append(f'{prefix}_phase_seconds_sum{{phase="{phase}"}} {t["seconds"]!r}')
+            lines.append(f'{prefix}_phase_seconds_count{{phase="{phase}"}} {t["count"]}')
+        lines += [f'# HELP {prefix}_phase_bytes_total Bytes read or produced by each render phase.',
+                  f'# TYPE {prefix}_phase_bytes_total counter']
+        lines += [f'{prefix}_phase_bytes_total{{phase="{phase}"}} {t["bytes"]}' for phase, t in totals.items()]
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        """Forget all events and totals."""
+        with self._lock:
+            self.events.clear()
+            self.totals.clear()
+
+    def __repr__(self):
+        return f"RenderMetrics(phases={len(self.totals)}, events={len(self.events)})"
+
+# %% ../nbs/00_core.ipynb 18
+@contextmanager
+def record_phases(
+        hook=None # The phase hook to register, a new `RenderMetrics` by default
+        ):
+    """Register `hook` for the render phases of every thread until the block exits, yielding it."""
+    hook = RenderMetrics() if hook is None else hook
+    add_phase_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_phase_hook(hook)
+
+# %% ../nbs/00_core.ipynb 21
 class Post:
     """Represents a blog post with its metadata and content. This class provides methods 
     to render the post content with optional code execution and formatting options."""
+    # Slots instead of an instance dict keep tens of thousands of loaded posts small
+    __slots__ = ('path', 'metadata', 'slug', '_date')
+    
     def __init__(
             self, # The post to initialize
             path: Path, # The path to the post
@@ -40,70 +379,266 @@ class Post:
         self.path = path
         self.metadata = metadata
         self.slug = slug
-        self._execution_state = {}
+        self._date = None  # (date_format, parsed date) cached by `get_post_date`
         
     def __getitem__(self, key):
         return self.metadata[key]
     
     def __getattr__(self, name):
-        if name in self.metadata:
+        # Only called for names that aren't slots. `metadata` isn't set yet while unpickling, so don't recurse
+        if name != 'metadata' and name in self.metadata:
             return self.metadata[name]
         raise AttributeError(f"'Post' object has no attribute '{name}'")
     
     def render(
             self, # The post to render
             open_links_new_window: bool = False, # Whether to open links in a new window
-            live_label: bool = True # Whether to show the live label
+            live_label: bool = True, # Whether to show the live label
+            cache: 'bool|RenderCache' = True, # The `RenderCache` to use, `True` for the shared `render_cache` or `False` to always re-render
+            use_stored_outputs: bool = False, # Show the outputs saved in a notebook instead of executing its cells
+            executor=None, # A `ProcessExecutor` to run the code blocks in instead of this process
+            memo=False # The `BlockMemo` to reuse unchanged code blocks from, `True` for the shared `block_memo`, used even if `cache` is `False`
             ) -> NotStr:
         """Render the post content with code execution as specified by tags."""
+        render_fn, _, options = self._renderer(open_links_new_window, live_label, use_stored_outputs, executor, memo)
+        with _phase('render', path=self.path) as phase:
+            if cache is False or cache is None:
+                html = render_fn(self, **options)
+            else:
+                html = (render_cache if cache is True else cache).render(self, render_fn, **options)
+            phase['data'] = html
+        return html
+    
+    async def arender(
+            self, # The post to render
+            open_links_new_window: bool = False, # Whether to open links in a new window
+            live_label: bool = True, # Whether to show the live label
+            cache: 'bool|RenderCache' = True, # The `RenderCache` to use, `True` for the shared `render_cache` or `False` to always re-render
+            use_stored_outputs: bool = False, # Show the outputs saved in a notebook instead of executing its cells
+            executor=None, # A `ProcessExecutor` to run the code blocks in instead of this process
+            thread_pool: Optional[Executor] = None, # The executor to render in, `None` for the event loop's default
+            memo=False # The `BlockMemo` to reuse unchanged code blocks from, `True` for the shared `block_memo`, used even if `cache` is `False`
+            ) -> NotStr:
+        """Render the post like `render` without blocking the event loop. Concurrent calls for the same post and
+        options share one render, counted in `render_flights`."""
+        options = {'open_links_new_window': open_links_new_window, 'live_label': live_label, 'use_stored_outputs': use_stored_outputs}
+        key = ('render', str(self.path), *sorted(options.items()))
+        render = partial(self.render, cache=cache, executor=executor, memo=memo, **options)
+        return await render_flights.run(key, render, executor=thread_pool)
+    
+    def render_stream(
+            self, # The post to render
+            open_links_new_window: bool = False, # Whether to open links in a new window
+            live_label: bool = True, # Whether to show the live label
+            cache: 'bool|RenderCache' = True, # The `RenderCache` to use, `True` for the shared `render_cache` or `False` to always re-render
+            use_stored_outputs: bool = False, # Show the outputs saved in a notebook instead of executing its cells
+            executor=None, # A `ProcessExecutor` to run the code blocks in instead of this process
+            memo=False # The `BlockMemo` to reuse unchanged code blocks from, `True` for the shared `block_memo`, used even if `cache` is `False`
+            ) -> Iterator[str]: # The HTML of the post in fragments
+        """Render the post like `render`, yielding the HTML of each markdown segment and code block as soon as it
+        is ready. A cached render is yielded in one piece, and a completed render is added to the cache. Its
+        `render` phase has `stream=True` and lasts until the last fragment, including time spent by the consumer."""
+        with _phase('render', path=self.path, stream=True) as phase:
+            for fragment in self._stream(open_links_new_window, live_label, cache, use_stored_outputs, executor, memo):
+                if phase:
+                    phase['bytes'] = phase.get('bytes', 0) + len(fragment.encode())
+                yield fragment
+
+    def _stream(self, open_links_new_window, live_label, cache, use_stored_outputs, executor, memo) -> Iterator[str]:
+        # The fragments of `render_stream`, from the cache if possible
+        _, stream_fn, options = self._renderer(open_links_new_window, live_label, use_stored_outputs, executor, memo)
+        if cache is False or cache is None:
+            yield from stream_fn(self, **options)
+            return
+        if cache is True:
+            cache = render_cache
+        key = cache.key(self, **options)
+        html = cache.get(key)
+        if html is not None:
+            yield html
+            return
+        fragments = []
+        for fragment in stream_fn(self, **options):
+            fragments.append(fragment)
+            yield fragment
+        cache.set(key, ''.join(fragments))
+    
+    def _renderer(self, open_links_new_window, live_label, use_stored_outputs, executor, memo=False) -> Tuple:
+        # The render and streaming functions for the post's file type, and the options that make up the cache key
+        options = {'open_links_new_window': open_links_new_window, 'live_label': live_label}
         if self.path.suffix == '.md':
-            return render_markdown_post(self, open_links_new_window, live_label)
+            render_fn, stream_fn = render_markdown_post, iter_markdown_post
         elif self.path.suffix == '.ipynb':
-            return render_notebook_post(self, open_links_new_window, live_label)
+            render_fn, stream_fn = render_notebook_post, iter_notebook_post
+            options['use_stored_outputs'] = use_stored_outputs
         else:
             raise ValueError(f"Unsupported file type: {self.path.suffix}")
+        # The executor and memo only change how blocks run, not the output, so they are not part of the cache key
+        extra = {'executor': executor, 'memo': memo}
+        return partial(render_fn, **extra), partial(stream_fn, **extra), options
+    
+    def etag(
+            self, # The post
+            open_links_new_window: bool = False, # Whether to open links in a new window
+            live_label: bool = True, # Whether to show the live label
+            use_stored_outputs: bool = False # Show the outputs saved in a notebook instead of executing its cells
+            ) -> str: # A quoted strong entity tag, e.g. `'"3f2a..."'`
+        """Return an HTTP entity tag for the post rendered with these options, derived from the content hash of
+        its file, so it only changes when the file or the options do. Computing it doesn't render the post."""
+        _, _, options = self._renderer(open_links_new_window, live_label, use_stored_outputs, None)
+        # The same key as the stored renders, which includes the library version since its output may change between releases
+        key = render_cache.key(self, **options)
+        return '"' + hashlib.sha256(_store_key(key).encode()).hexdigest()[:32] + '"'
+    
+    @property
+    def last_modified(self) -> datetime:
+        """The modification time of the post's file as a UTC datetime, truncated to whole seconds as in HTTP dates."""
+        return datetime.fromtimestamp(int(self.path.stat().st_mtime), dt.timezone.utc)
     
     def __repr__(self):
         return f"Post(slug='{self.slug}', title='{self.metadata.get('title', 'Untitled')}', path='{self.path}')"
 
-# %% ../nbs/00_core.ipynb 10
+# %% ../nbs/00_core.ipynb 28
+def _read_frontmatter_block(
+        f, # A text file object positioned at the start of the content
+        chunk_size: int = 4096 # Number of characters to read at a time
+        ) -> Optional[str]:
+    """Read only as far as the closing `---` fence and return the text between the fences, or `None`."""
+    buf = f.read(3)
+    if buf != '---':
+        return None
+    start = 3
+    while True:
+        end = buf.find('---', start)
+        if end >= 0:
+            return buf[3:end]
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return None
+        # A fence may straddle two chunks
+        start = max(3, len(buf) - 2)
+        buf += chunk
+
+# %% ../nbs/00_core.ipynb 29
 def extract_frontmatter(
         file_path: Path # The path to the file to extract the frontmatter from
         ) -> AttrDict:
-    """Extract YAML frontmatter from a Markdown file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    """Extract YAML frontmatter from a Markdown file, reading only up to the closing `---`."""
+    with _phase('read', path=file_path) as phase, open(file_path, 'r', encoding='utf-8') as f:
+        phase['data'] = yaml_content = _read_frontmatter_block(f)
     
-    # Check if the file starts with frontmatter (---)
-    if content.startswith('---'):
-        # Split on the second --- to get frontmatter
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            try:
-                yaml_content = parts[1].strip()
-                metadata = yaml.safe_load(yaml_content) or {}
-                return AttrDict(metadata)
-            except yaml.YAMLError as e:
-                logger.error(f"Error parsing YAML frontmatter in {file_path}: {e}")
+    # Check if the file starts with frontmatter between --- fences
+    if yaml_content is not None:
+        try:
+            with _phase('frontmatter', path=file_path):
+                metadata = yaml.safe_load(yaml_content.strip()) or {}
+            return AttrDict(metadata)
+        except yaml.YAMLError as e:
+            logger.error(f"Error parsing YAML frontmatter in {file_path}: {e}")
     
     # Return empty metadata if no frontmatter found
     return AttrDict({})
 
-# %% ../nbs/00_core.ipynb 14
+# %% ../nbs/00_core.ipynb 33
+class _JSONScanner:
+    """Incrementally decode JSON values from a text file, reading more only when a value is incomplete."""
+    _ws = re.compile(r'[ \t\n\r]*')
+    _decoder = json.JSONDecoder()
+    
+    def __init__(self, f, chunk_size: int = 8192):
+        self.f, self.chunk_size = f, chunk_size
+        self.buf, self.pos, self.eof = '', 0, False
+    
+    def _more(self):
+        if self.eof:
+            raise ValueError("Unexpected end of JSON")
+        chunk = self.f.read(self.chunk_size)
+        self.chunk_size *= 2
+        self.eof = not chunk
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character."""
+        while True:
+            self.pos = self._ws.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self._more()
+    
+    def expect(self, char: str):
+        """Consume `char`, raising `ValueError` if the next character is anything else."""
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}")
+        self.pos += 1
+    
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                pass
+            self._more()
+
+# %% ../nbs/00_core.ipynb 34
+def _read_first_notebook_cell(
+        f # A text file object of a notebook
+        ) -> Optional[Dict]:
+    """Return the first cell of a v4 notebook without reading past it, `None` if it has no cells.
+    Raises `ValueError` if the file can't be scanned, e.g. it is an older notebook format."""
+    scanner = _JSONScanner(f)
+    scanner.expect('{')
+    if scanner.peek() == '}':
+        raise ValueError("No cells in notebook")
+    while True:
+        key = scanner.value()
+        scanner.expect(':')
+        if key == 'cells':
+            scanner.expect('[')
+            return None if scanner.peek() == ']' else scanner.value()
+        value = scanner.value()
+        if key == 'nbformat' and value != 4:
+            raise ValueError(f"Unsupported nbformat {value}")
+        if scanner.peek() != ',':
+            raise ValueError("No cells in notebook")
+        scanner.expect(',')
+
+# %% ../nbs/00_core.ipynb 35
 def extract_notebook_frontmatter(
         file_path: Path # The path to the notebook to extract the frontmatter from
         ) -> AttrDict:
-    """Extract YAML frontmatter from a Jupyter Notebook file."""
-    notebook = nbformat.read(file_path, as_version=4)
+    """Extract YAML frontmatter from a Jupyter Notebook file. The notebook JSON is scanned incrementally
+    and reading stops after the first cell, so large outputs later in the notebook are never read."""
+    try:
+        with _phase('read', path=file_path) as phase, open(file_path, 'r', encoding='utf-8') as f:
+            try:
+                first_cell = _read_first_notebook_cell(f)
+            finally:
+                # The bytes read from the file so far, which stops soon after the first cell
+                if phase:
+                    phase['bytes'] = f.buffer.tell()
+    except ValueError:
+        # Fall back to nbformat for notebooks that can't be scanned, e.g. older formats
+        notebook = nbformat.read(file_path, as_version=4)
+        first_cell = notebook.cells[0] if len(notebook.cells) > 0 else None
     
     # Check if the first cell is raw and contains frontmatter
-    if len(notebook.cells) > 0 and notebook.cells[0].cell_type == 'raw':
-        cell_content = notebook.cells[0].source
+    if first_cell is not None and first_cell.get('cell_type') == 'raw':
+        cell_content = first_cell.get('source', '')
+        if isinstance(cell_content, list):
+            cell_content = ''.join(cell_content)
         if cell_content.startswith('---') and '---' in cell_content[3:]:
             try:
                 # Extract content between first two --- markers
                 yaml_content = cell_content.split('---', 2)[1].strip()
-                metadata = yaml.safe_load(yaml_content) or {}
+                with _phase('frontmatter', path=file_path):
+                    metadata = yaml.safe_load(yaml_content) or {}
                 return AttrDict(metadata)
             except yaml.YAMLError as e:
                 logger.error(f"Error parsing YAML frontmatter in {file_path}: {e}")
@@ -111,54 +646,358 @@ def extract_notebook_frontmatter(
     # Return empty metadata if no frontmatter found
     return AttrDict({})
 
-# %% ../nbs/00_core.ipynb 19
+# %% ../nbs/00_core.ipynb 43
+# Formats tried after the one passed to `parse_date`, before falling back to ISO 8601
+DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%d %B %Y", "%d %b %Y", "%Y-%m-%d", "%Y/%m/%d")
+
+def parse_date(
+        value, # A date string, or a `date` or `datetime` e.g. from an unquoted YAML date
+        date_format: Optional[str] = None # The format to try first i.e. "%B %d, %Y"
+        ) -> Optional[datetime]: # A naive datetime, in UTC if `value` had a timezone, or `None`
+    """Parse a post date with `date_format`, the common `DATE_FORMATS` or ISO 8601."""
+    if isinstance(value, datetime):
+        date = value
+    elif isinstance(value, dt.date):
+        return datetime(value.year, value.month, value.day)
+    elif isinstance(value, str):
+        value = value.strip()
+        for fmt in ((date_format,) if date_format else ()) + DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        try:
+            date = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    # Aware and naive datetimes can't be compared, so sort every date as naive UTC
+    return date.astimezone(dt.timezone.utc).replace(tzinfo=None) if date.tzinfo else date
+
 def get_post_date(
         post, # The post to get the date from
         date_format="%B %d, %Y" # The format string for the date i.e. "January 01, 2025"
         ) -> datetime:
-    """Extract date from post for sorting."""
-    
-    if 'date' in post.metadata:
-        try:
-            return datetime.strptime(post.metadata['date'], date_format)
-        except:
-            pass
-    return datetime.min
+    """Extract date from post for sorting, or `datetime.min` if it has none. The date is parsed once and
+    cached on the post."""
+    cached = post._date
+    if cached is not None and cached[0] == date_format:
+        return cached[1]
+    date = parse_date(post.metadata['date'], date_format) if 'date' in post.metadata else None
+    if date is None:
+        date = datetime.min
+    post._date = (date_format, date)
+    return date
 
-# %% ../nbs/00_core.ipynb 21
+# %% ../nbs/00_core.ipynb 50
+def _post_tags(post) -> List[str]:
+    "The post's `tags` as strings, accepting a single tag written without a list, e.g. `tags: python` or `tags: 5`."
+    tags = post.metadata.get('tags')
+    if tags is None:
+        return []
+    return [str(tag) for tag in (tags if isinstance(tags, (list, tuple, set)) else [tags])]
+
+def _sort_key(date: datetime, path: Path) -> tuple:
+    "Ascending keys give newest first, with ties broken like `load_posts`: markdown files before notebooks, then by name."
+    return (datetime.max - date, path.suffix != '.md', path.name, str(path))
+
+def _encode_cursor(key: tuple) -> str:
+    "A cursor for `PostCollection.page` marking the post with sort `key` as the last one seen."
+    return base64.urlsafe_b64encode(json.dumps([(datetime.max - key[0]).isoformat(), key[3]]).encode()).decode()
+
+def _decode_cursor(cursor: str) -> tuple:
+    "The sort key of the last post seen, from a cursor returned by `PostCollection.page`."
+    try:
+        date, path = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        date = datetime.fromisoformat(date)
+    except (ValueError, TypeError) as e:
+        # Also covers invalid base64, JSON or UTF-8, which raise subclasses of `ValueError`
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(path, str) or date.tzinfo is not None:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return _sort_key(date, Path(path))
+
+# %% ../nbs/00_core.ipynb 51
+class PostCollection(list):
+    """A list of posts, newest first when returned by `load_posts`, with slug and tag lookups, date range
+    queries and cursor pagination that don't scan the whole list."""
+    def __init__(
+            self, # The collection to initialize
+            posts: Iterable[Post] = (), # The posts, in the order the list should have
+            date_format: str = "%B %d, %Y" # The format string for the date i.e. "January 01, 2025"
+            ):
+        super().__init__(posts)
+        self.date_format = date_format
+        self._index = None
+
+    def _indexes(self) -> Dict:
+        # Built lazily, and rebuilt after the list is modified
+        if self._index is None:
+            by_slug, by_tag = {}, {}
+            for post in self:
+                by_slug.setdefault(post.slug, post)
+                for tag in _post_tags(post):
+                    by_tag.setdefault(tag, []).append(post)
+            # Sorted newest first with the same tie-break as `load_posts`, so ranges are found with `bisect`
+            dated = sorted(((_sort_key(get_post_date(post, self.date_format), post.path), post) for post in self),
+                           key=lambda item: item[0])
+            self._index = {'slug': by_slug, 'tag': by_tag,
+                           'keys': [key for key, _ in dated], 'dated': [post for _, post in dated]}
+        return self._index
+
+    def get(
+            self, # The collection
+            slug: str, # The slug of the post
+            default=None # The value to return if there is no post with `slug`
+            ) -> Optional[Post]:
+        """Return the post with `slug`, the first in the list if several share it, or `default`."""
+        return self._indexes()['slug'].get(slug, default)
+
+    def tagged(self, tag: str) -> List[Post]:
+        """Return the posts with `tag`, in list order."""
+        return list(self._indexes()['tag'].get(tag, []))
+
+    @property
+    def tags(self) -> Dict[str, int]:
+        """The number of posts with each tag."""
+        return {tag: len(posts) for tag, posts in self._indexes()['tag'].items()}
+
+    def between(
+            self, # The collection
+            start: Optional[datetime] = None, # The earliest date to include, `None` for no lower bound
+            end: Optional[datetime] = None # The date to stop before, `None` for no upper bound
+            ) -> List[Post]:
+        """Return the posts dated from `start` up to but not including `end`, newest first."""
+        index = self._indexes()
+        # The keys start with the time before `datetime.max`, which is larger the older the post is
+        before_max = lambda key: key[0]
+        lo = 0 if end is None else bisect.bisect_right(index['keys'], datetime.max - end, key=before_max)
+        hi = len(index['keys']) if start is None else bisect.bisect_right(index['keys'], datetime.max - start, key=before_max)
+        return index['dated'][lo:hi]
+
+    def in_month(self, year: int, month: int) -> List[Post]:
+        """Return the posts dated in `month` of `year`, newest first."""
+        end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+        return self.between(datetime(year, month, 1), end)
+
+    def page(
+            self, # The collection
+            cursor: Optional[str] = None, # The cursor returned with the previous page, `None` for the first page
+            limit: int = 10 # The maximum number of posts on the page
+            ) -> Tuple[List[Post], Optional[str]]: # The posts, newest first, and the cursor of the next page or `None`
+        """Return a page of posts and the cursor for the next one. A cursor marks the last post seen, so pages
+        stay consistent when posts are added or removed between requests. Posts with the same date are in the order
+        `load_posts` gives them. Raises `ValueError` if `limit` is less than 1 or `cursor` wasn't returned by `page`,
+        e.g. when it was edited in a query string."""
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        index = self._indexes()
+        lo = 0 if cursor is None else bisect.bisect_right(index['keys'], _decode_cursor(cursor))
+        hi = lo + limit
+        posts = index['dated'][lo:hi]
+        if hi >= len(index['keys']):
+            return posts, None
+        return posts, _encode_cursor(index['keys'][hi - 1])
+
+def _invalidates_index(method):
+    # Wrap a list method that modifies the list so the indexes are rebuilt on the next lookup
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._index = None
+        return result
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse', '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(PostCollection, _name, _invalidates_index(getattr(list, _name)))
+
+# %% ../nbs/00_core.ipynb 56
+def load_post(
+        file_path: str|Path # The path to a markdown or notebook post
+        ) -> Post:
+    """Load a single post, extracting its frontmatter with `extract_frontmatter` or `extract_notebook_frontmatter`
+    depending on the file type. The slug is the file name without its extension."""
+    file_path = Path(file_path)
+    if file_path.suffix == '.md':
+        metadata = extract_frontmatter(file_path)
+    elif file_path.suffix == '.ipynb':
+        metadata = extract_notebook_frontmatter(file_path)
+    else:
+        raise ValueError(f"Unsupported file type: {file_path.suffix}")
+    return Post(file_path, metadata, file_path.stem)
+
+# %% ../nbs/00_core.ipynb 58
+def _write_atomic(
+        path: Path, # The file to write
+        text: str # The text to write, as UTF-8
+        ):
+    """Write `text` to a temporary file next to `path` and rename it over `path`, so readers never see a partial
+    file. The temporary file is named after the process and thread, and removed if writing fails."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding='utf-8')
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+# %% ../nbs/00_core.ipynb 60
+_MANIFEST_NAME = '.fh_posts_manifest.json'
+_MANIFEST_VERSION = 2
+
+def _encode_date(value) -> Dict:
+    # `json.dumps` default for the dates YAML parses unquoted, e.g. `date: 2025-03-01`
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, dt.date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _decode_dates(value):
+    # The inverse of `_encode_date`, for metadata loaded from the manifest
+    if isinstance(value, dict):
+        if len(value) == 1 and '__datetime__' in value:
+            return datetime.fromisoformat(value['__datetime__'])
+        if len(value) == 1 and '__date__' in value:
+            return dt.date.fromisoformat(value['__date__'])
+        return {k: _decode_dates(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_dates(v) for v in value]
+    return value
+
+def _manifest_entry(post: Post, st: os.stat_result, date_format: str) -> Optional[Dict]:
+    # Only metadata that survives a JSON round trip unchanged can be cached, with dates stored in a tagged form
+    metadata = dict(post.metadata)
+    try:
+        encoded = json.loads(json.dumps(metadata, default=_encode_date))
+        if _decode_dates(encoded) != metadata:
+            return None
+    except (TypeError, ValueError):
+        return None
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'slug': post.slug, 'metadata': encoded,
+            'date': get_post_date(post, date_format).isoformat()}
+
+def _read_manifest(manifest_path: Path, date_format: str) -> Dict:
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+    if manifest.get('version') != _MANIFEST_VERSION or manifest.get('date_format') != date_format:
+        return {}
+    return manifest.get('posts', {})
+
+def _write_manifest(manifest_path: Path, entries: Dict, date_format: str):
+    try:
+        _write_atomic(manifest_path, json.dumps({'version': _MANIFEST_VERSION, 'date_format': date_format, 'posts': entries}))
+    except OSError as e:
+        logger.warning(f"Could not write manifest {manifest_path}: {e}")
+
+# %% ../nbs/00_core.ipynb 61
+def _load_post_file(
+        file_path: Path, # The path to the post
+        date_format: str, # The format string for the date
+        use_manifest: bool = False, # Whether `load_posts` is using a manifest
+        entry: Optional[Dict] = None # The file's manifest entry, if any
+        ) -> tuple: # (post, manifest entry)
+    """Load one post for `load_posts`, reusing its manifest `entry` if the file is unchanged. The post's date
+    is parsed here, possibly in a worker, so sorting doesn't have to."""
+    if not use_manifest:
+        post = load_post(file_path)
+        get_post_date(post, date_format)
+        return post, None
+    st = file_path.stat()
+    if entry and (entry['size'], entry['mtime_ns']) == (st.st_size, st.st_mtime_ns):
+        post = Post(file_path, AttrDict(_decode_dates(entry['metadata'])), entry['slug'])
+        post._date = (date_format, datetime.fromisoformat(entry['date']))
+        return post, entry
+    post = load_post(file_path)
+    return post, _manifest_entry(post, st, date_format)
+
+def _try_load_post_file(args: tuple) -> tuple:
+    # Return errors instead of raising so they are logged by `load_posts`, even from another process
+    try:
+        return _load_post_file(*args), None
+    except Exception as e:
+        return None, e
+
+# %% ../nbs/00_core.ipynb 62
 def load_posts(
         path: str|Path, # The path to the directory containing the posts
-        date_format: str = "%B %d, %Y" # The format string for the date i.e. "January 01, 2025"
-        ) -> List[Post]:
+        date_format: str = "%B %d, %Y", # The format string for the date i.e. "January 01, 2025"
+        manifest: bool|str|Path = False, # Cache parsed frontmatter in a manifest file, `True` for `.fh_posts_manifest.json` in `path`
+        workers: int = 1, # Number of threads to extract frontmatter with
+        executor: Optional[Executor] = None # Executor to extract frontmatter with instead, e.g. a `ProcessPoolExecutor`
+        ) -> PostCollection:
     """Load all posts from the specified directory. Extracts frontmatter from markdown files and notebooks
     with `extract_frontmatter` and `extract_notebook_frontmatter` respectively. Specify optional date format 
-    string for `get_post_date` to sort posts by date."""
-    
-    posts_dir = Path(path)
+    string for `get_post_date` to sort posts by date. With a `manifest`, only files whose size or mtime
+    changed since the manifest was written are parsed again."""
+    with _phase('load_posts', path=Path(path)) as phase:
+        posts = _load_posts(Path(path), date_format, manifest, workers, executor)
+        phase['posts'] = len(posts)
+    return posts
+
+def _load_posts(posts_dir: Path, date_format: str, manifest: bool|str|Path, workers: int, executor: Optional[Executor]) -> PostCollection:
+    # The body of `load_posts`, timed as its `load_posts` phase
     posts = []
     
-    # Process Markdown files
-    for file_path in posts_dir.glob("*.md"):
-        try:
-            metadata = extract_frontmatter(file_path)
-            slug = file_path.stem
-            posts.append(Post(file_path, metadata, slug))
-        except Exception as e:
-            logger.error(f"Error processing {file_path}: {e}")
+    manifest_path = None
+    entries, new_entries = {}, {}
+    if manifest:
+        manifest_path = posts_dir/_MANIFEST_NAME if manifest is True else Path(manifest)
+        entries = _read_manifest(manifest_path, date_format)
     
-    # Process Jupyter Notebook files
-    for file_path in posts_dir.glob("*.ipynb"):
-        try:
-            metadata = extract_notebook_frontmatter(file_path)
-            slug = file_path.stem
-            posts.append(Post(file_path, metadata, slug))
-        except Exception as e:
-            logger.error(f"Error processing {file_path}: {e}")
+    # Process Markdown files, then Jupyter Notebook files, in name order so ties in date sort the same way every time
+    file_paths = [*sorted(posts_dir.glob("*.md")), *sorted(posts_dir.glob("*.ipynb"))]
+    jobs = [(file_path, date_format, manifest_path is not None, entries.get(file_path.name)) for file_path in file_paths]
+    
+    own_executor = executor is None and workers > 1
+    if own_executor:
+        executor = ThreadPoolExecutor(workers)
+    try:
+        # `map` returns results in input order, so the output doesn't depend on which worker finishes first
+        results = executor.map(_try_load_post_file, jobs, chunksize=16) if executor else map(_try_load_post_file, jobs)
+        for file_path, (loaded, error) in zip(file_paths, results):
+            if error is not None:
+                logger.error(f"Error processing {file_path}: {error}")
+                continue
+            post, entry = loaded
+            posts.append(post)
+            if entry:
+                new_entries[file_path.name] = entry
+    finally:
+        if own_executor:
+            executor.shutdown()
+    
+    if manifest_path is not None and new_entries != entries:
+        _write_manifest(manifest_path, new_entries, date_format)
     
     # Sort posts by date if available, newest first
-    return sorted(posts, key=lambda post: get_post_date(post), reverse=True)
+    posts.sort(key=lambda post: get_post_date(post, date_format), reverse=True)
+    return PostCollection(posts, date_format)
+
+# %% ../nbs/00_core.ipynb 74
+async def aload_posts(
+        path: str|Path, # The path to the directory containing the posts
+        date_format: str = "%B %d, %Y", # The format string for the date i.e. "January 01, 2025"
+        manifest: bool|str|Path = False, # Cache parsed frontmatter in a manifest file, see `load_posts`
+        workers: int = 1, # Number of threads to extract frontmatter with
+        executor: Optional[Executor] = None, # Executor to extract frontmatter with instead, e.g. a `ProcessPoolExecutor`
+        thread_pool: Optional[Executor] = None # The executor to run `load_posts` in, `None` for the event loop's default
+        ) -> PostCollection:
+    """Load posts like `load_posts` without blocking the event loop. Concurrent calls for the same directory
+    share one load, counted in `render_flights`."""
+    key = ('load_posts', str(Path(path).resolve()), date_format, str(manifest))
+    load = partial(load_posts, path, date_format, manifest=manifest, workers=workers, executor=executor)
+    # Each caller gets its own collection so changing it doesn't affect the others
+    return PostCollection(await render_flights.run(key, load, executor=thread_pool), date_format)
 
-# %% ../nbs/00_core.ipynb 27
+# %% ../nbs/00_core.ipynb 77
 def parse_tag(tag_str: str) -> Dict[str, bool]:
     """Parse a tag string into a dict of tag properties e.g., 'python:run:hide-in'."""
     # Default properties
@@ -196,55 +1035,124 @@ def parse_tag(tag_str: str) -> Dict[str, bool]:
     
     return tag_props
 
-# %% ../nbs/00_core.ipynb 31
+# %% ../nbs/00_core.ipynb 82
+_BASE_MARKER = '__fh_posts_base__'
+
+@lru_cache(maxsize=None)
+def _base_namespace() -> Dict:
+    """The template namespace with the default imports, built on first use."""
+    namespace = {}
+    exec('from fasthtml.common import *', namespace)
+    exec('from monsterui.all import *', namespace)
+    namespace[_BASE_MARKER] = True
+    return namespace
+
+def new_namespace() -> Dict:
+    """Return a fresh execution namespace with `fasthtml.common` and `monsterui.all` imported."""
+    return dict(_base_namespace())
+
+# %% ../nbs/00_core.ipynb 85
+_capture_buffer = contextvars.ContextVar('fh_posts_capture_buffer', default=None)
+_capture_lock = threading.Lock()
+
+class _CaptureStream:
+    """A stand-in for `sys.stdout` or `sys.stderr` that writes to the capture buffer of the current context."""
+    def __init__(self, stream):
+        self._stream = stream
+
+    def _target(self):
+        buffer = _capture_buffer.get()
+        return self._stream if buffer is None else buffer
+
+    def write(self, s):
+        return self._target().write(s)
+
+    def writelines(self, lines):
+        return self._target().writelines(lines)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+def _install_capture():
+    # Check every time as a test runner or notebook kernel may have replaced the streams since
+    if isinstance(sys.stdout, _CaptureStream) and isinstance(sys.stderr, _CaptureStream):
+        return
+    with _capture_lock:
+        if not isinstance(sys.stdout, _CaptureStream):
+            sys.stdout = _CaptureStream(sys.stdout)
+        if not isinstance(sys.stderr, _CaptureStream):
+            sys.stderr = _CaptureStream(sys.stderr)
+
+@contextmanager
+def _capture_output():
+    """Capture everything written to stdout and stderr in the current context into a `StringIO`."""
+    _install_capture()
+    buffer = io.StringIO()
+    token = _capture_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _capture_buffer.reset(token)
+
+# %% ../nbs/00_core.ipynb 88
+@lru_cache(maxsize=1024)
+def _compile_block(
+        code: str # The code block's source
+        ) -> Tuple[types.CodeType, Optional[types.CodeType], Optional[ast.expr]]:
+    """Compile `code` into its statements, its final expression or `None`, and the final expression's AST node."""
+    tree = ast.parse(code)
+    last = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        last = tree.body.pop().value
+    body = compile(tree, '<string>', 'exec')
+    last_expr = compile(ast.Expression(last), '<string>', 'eval') if last is not None else None
+    return body, last_expr, last
+
+def _without_last_expr(
+        code: str # The code block's source
+        ) -> str:
+    """Return `code` with its final expression removed, or unchanged if it doesn't end with one."""
+    try:
+        last = _compile_block(code)[2]
+    except SyntaxError:
+        return code
+    if last is None:
+        return code
+    lines = code.split('\n')
+    # Keep statements before the expression on its first line, e.g. `x = 1; x`; offsets are in UTF-8 bytes
+    head = lines[last.lineno - 1].encode()[:last.col_offset].decode().rstrip().rstrip(';').rstrip()
+    return '\n'.join(lines[:last.lineno - 1] + ([head] if head else []) + lines[last.end_lineno:])
+
+# %% ../nbs/00_core.ipynb 90
 def execute_code(
         code: str, # The code to execute
         namespace: Optional[Dict] = None # Optional namespace to use for execution
         ) -> Dict: # Returns a dict with keys: output (captured stdout), error (captured stderr), result (last expression result), namespace (updated namespace)
     """Execute Python code and return the execution result."""
     if namespace is None:
-        namespace = {}
-    
-    # Add default imports
-    if 'from fasthtml.common import' not in code and 'fasthtml' not in namespace:
-        exec('from fasthtml.common import *', namespace)
-    if 'from monsterui.all import' not in code and 'monsterui' not in namespace:
-        exec('from monsterui.all import *', namespace)
-    
-    # Capture stdout and stderr
-    orig_stdout, orig_stderr = sys.stdout, sys.stderr
-    captured_output = io.StringIO()
-    sys.stdout = sys.stderr = captured_output
+        namespace = new_namespace()
+    elif _BASE_MARKER not in namespace:
+        # Add the default imports once, without replacing names the namespace already defines
+        for name, value in _base_namespace().items():
+            namespace.setdefault(name, value)
     
     result = None
     error = None
     
-    try:
-        # Execute the code
-        exec_result = exec(code, namespace)
-        
-        # Try to get the last expression result if it's an expression
+    # Capture stdout and stderr for this context only, so blocks running in other threads keep their own output
+    with _capture_output() as captured_output:
         try:
-            last_line = code.strip().split('\n')[-1]
-            if not (last_line.startswith('#') or 
-                    re.match(r'^\s*$', last_line) or
-                    '=' in last_line or 
-                    last_line.startswith('def ') or
-                    last_line.startswith('class ') or
-                    last_line.startswith('import ') or
-                    last_line.startswith('from ') or
-                    last_line.startswith('print(')):  # Skip print statements
-                # It seems to be an expression, re-evaluate to get its result
-                result = eval(last_line, namespace)
-        except:
-            # Not an expression or other issue, use exec result
-            result = exec_result
-    except Exception as e:
-        error = str(e)
-    finally:
-        # Restore stdout and stderr
-        output = captured_output.getvalue()
-        sys.stdout, sys.stderr = orig_stdout, orig_stderr
+            # Run the statements, then evaluate the final expression once for its result
+            body, last_expr, _ = _compile_block(code)
+            exec(body, namespace)
+            if last_expr is not None:
+                result = eval(last_expr, namespace)
+        except Exception as e:
+            error = str(e)
+    output = captured_output.getvalue()
     
     return {
         'output': output,
@@ -253,7 +1161,7 @@ def execute_code(
         'namespace': namespace
     }
 
-# %% ../nbs/00_core.ipynb 35
+# %% ../nbs/00_core.ipynb 99
 def process_code_block(
         tag_props: Dict[str, bool], # Dict of tag properties    
         code: str, # Python code to execute
@@ -266,7 +1174,7 @@ def process_code_block(
         'show_output': not tag_props['hide_out'],
         'code_html': '',
         'output_html': '',
-        'namespace': namespace or {}
+        'namespace': namespace if namespace is not None else new_namespace()
     }
     
     # Process code for display (handle the hide-call option)
@@ -292,8 +1200,9 @@ def process_code_block(
         if execution_result['result'] is not None:
             try:
                 # Convert result to FastHTML XML
-                result_html = to_xml(execution_result['result'])
-                output_html.append(str(result_html))
+                with _phase('to_xml') as phase:
+                    phase['data'] = result_html = str(to_xml(execution_result['result']))
+                output_html.append(result_html)
             except:
                 # Fallback to string representation
                 output_html.append(f'<pre class="result">{execution_result["result"]}</pre>')
@@ -302,15 +1211,8 @@ def process_code_block(
     
     # Process code for display (handle hide-call option if needed)
     if tag_props['hide_call']:
-        # If not showing the call, try to hide the last line if it's an expression
-        lines = display_code.split('\n')
-        last_non_empty = next((i for i in range(len(lines)-1, -1, -1) 
-                              if lines[i].strip() and not lines[i].strip().startswith('#')), -1)
-        
-        if last_non_empty >= 0 and not ('=' in lines[last_non_empty] 
-                                       or lines[last_non_empty].strip().startswith(('def ', 'class ', 'import ', 'from '))):
-            lines = lines[:last_non_empty] + lines[last_non_empty+1:]
-            display_code = '\n'.join(lines)
+        # Hide the final expression, found the same way `execute_code` finds the block's result
+        display_code = _without_last_expr(display_code)
     
     # Format code HTML
     if result['show_code']:
@@ -318,16 +1220,293 @@ def process_code_block(
     
     return result
 
-# %% ../nbs/00_core.ipynb 37
-def render_markdown_post(
+# %% ../nbs/00_core.ipynb 102
+_missing = object()
+
+def _shallow_size(value) -> int:
+    # A cheap lower bound on the size of `value`, counting the items of containers but not what they refer to
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        size += 16 * len(value)
+    return size
+
+def _snapshot_namespace(
+        namespace: Dict, # The execution namespace after a block ran
+        max_bytes: Optional[int] = None # The largest snapshot to take, `None` for no limit
+        ) -> Optional[tuple]: # (pickled values, modules, functions to re-bind) or `None` if the namespace can't be restored
+    """Pickle the values the post's code added to `namespace`."""
+    imports = _base_namespace()
+    values, modules, functions = {}, {}, {}
+    size = 0
+    for name, value in namespace.items():
+        if name == '__builtins__' or imports.get(name, _missing) is value:
+            continue
+        if isinstance(value, types.FunctionType) and value.__globals__ is namespace:
+            functions[name] = value
+        elif isinstance(value, types.ModuleType):
+            modules[name] = value
+        elif isinstance(value, type) and any(getattr(v, '__globals__', None) is namespace for v in vars(value).values()):
+            # Methods of classes defined by the post would keep reading the old namespace
+            return None
+        else:
+            values[name] = value
+            # Give up before pickling a namespace that is clearly too large
+            size += _shallow_size(value)
+            if max_bytes is not None and size > max_bytes:
+                return None
+    try:
+        blob = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    if max_bytes is not None and len(blob) > max_bytes:
+        return None
+    return blob, modules, functions
+
+def _restore_namespace(
+        snapshot: tuple # A snapshot from `_snapshot_namespace`
+        ) -> Dict:
+    """Build a new execution namespace from `snapshot`, leaving the snapshot untouched."""
+    blob, modules, functions = snapshot
+    namespace = new_namespace()
+    namespace.update(modules)
+    namespace.update(pickle.loads(blob))
+    for name, f in functions.items():
+        g = types.FunctionType(f.__code__, namespace, f.__name__, f.__defaults__, f.__closure__)
+        g.__kwdefaults__, g.__qualname__, g.__doc__ = f.__kwdefaults__, f.__qualname__, f.__doc__
+        g.__annotations__, g.__module__ = f.__annotations__, f.__module__
+        g.__dict__.update(f.__dict__)
+        namespace[name] = g
+    return namespace
+
+# %% ../nbs/00_core.ipynb 103
+class BlockMemo:
+    """An LRU memo of executed code block outputs and namespace snapshots, keyed by the chained hash of the post's
+    path, the block's source and the sources of the blocks before it. Bounded by entry count and by memory."""
+    def __init__(
+            self, # The memo to initialize
+            maxsize: int = 1024, # The maximum number of blocks to remember
+            max_bytes: Optional[int] = 128 * 1024 * 1024, # The maximum memory used by outputs and snapshots, `None` for no limit
+            max_snapshot_bytes: Optional[int] = 8 * 1024 * 1024 # The largest namespace snapshot to keep, `None` for no limit
+            ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.max_snapshot_bytes = max_snapshot_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def chain_key(
+            prev_key: str, # The key of the previous block, the post's path for the first block
+            code: str # The block's source
+            ) -> str:
+        """Return the key of a block given the key of the block before it."""
+        return hashlib.sha256(f"{prev_key}\0{code}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the entry with the block's `output_html` and namespace `snapshot`, or `None`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, output_html: str, snapshot: Optional[tuple]):
+        """Remember the output of a block and the namespace it left behind, evicting least recently used entries
+        to stay within the bounds."""
+        nbytes = sys.getsizeof(output_html) + (len(snapshot[0]) if snapshot is not None else 0)
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = {'output_html': output_html, 'snapshot': snapshot, 'nbytes': nbytes}
+            self.nbytes += nbytes
+            while self._entries and (len(self._entries) > self.maxsize or
+                                     (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                self._evict(next(iter(self._entries)))
+
+    def _evict(self, key):
+        self.nbytes -= self._entries.pop(key)['nbytes']
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"BlockMemo(entries={len(self)}, nbytes={self.nbytes}, hits={self.hits}, misses={self.misses})"
+
+# %% ../nbs/00_core.ipynb 104
+# Shared memo used by `render_markdown_post`, `render_notebook_post` and `Post.render` when `memo=True`
+block_memo = BlockMemo()
+
+# %% ../nbs/00_core.ipynb 105
+class _BlockRunner:
+    """Run the code blocks of one render in order, serving the unchanged leading blocks from a `BlockMemo`."""
+    def __init__(
+            self, # The runner to initialize
+            memo: 'bool|BlockMemo' = False, # The `BlockMemo` to use, `True` for the shared `block_memo`
+            path: Optional[Path] = None # The post's file, so posts with the same blocks don't share outputs
+            ):
+        self.memo = block_memo if memo is True else (None if memo is False else memo)
+        self.key = str(Path(path).resolve()) if path is not None else ''
+        self.namespace = new_namespace() if self.memo is None else None  # `None` while blocks are served from the memo
+        self.last_hit = None
+        self.history = []  # Source of the blocks served from the memo
+
+    def process(
+            self, # The runner
+            tag_props: Dict[str, bool], # Dict of tag properties
+            code: str # Python code to execute
+            ) -> Dict: # The result of `process_code_block`
+        """Process the next code block of the post."""
+        if not tag_props['run'] or self.memo is None:
+            result = process_code_block(tag_props, code, self.namespace)
+            if tag_props['run']:
+                self.namespace = result['namespace']
+            return result
+
+        self.key = BlockMemo.chain_key(self.key, code)
+        if self.namespace is None:
+            entry = self.memo.get(self.key)
+            if entry is not None:
+                self.last_hit = entry
+                self.history.append(code)
+                result = process_code_block({**tag_props, 'run': False}, code)
+                result['output_html'] = entry['output_html']
+                return result
+            self.namespace = self._resume()
+
+        result = process_code_block(tag_props, code, self.namespace)
+        self.namespace = result['namespace']
+        self.memo.set(self.key, result['output_html'], _snapshot_namespace(self.namespace, self.memo.max_snapshot_bytes))
+        return result
+
+    def _resume(self) -> Dict:
+        # Rebuild the namespace the blocks served from the memo would have left behind
+        if self.last_hit is None:
+            return new_namespace()
+        if self.last_hit['snapshot'] is not None:
+            return _restore_namespace(self.last_hit['snapshot'])
+        namespace = new_namespace()
+        for code in self.history:
+            namespace = execute_code(code, namespace)['namespace']
+        return namespace
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+# %% ../nbs/00_core.ipynb 106
+class _LinkRewriter(HTMLParser):
+    """Find the anchor start tags in HTML and rebuild the ones that leave the site to open in a new window."""
+    def __init__(self, html_content: str):
+        super().__init__(convert_charrefs=False)
+        self.html_content = html_content
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', html_content)]
+        self.edits = []  # (start, end, replacement) of each rewritten tag
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a':
+            return
+        attrs = dict(attrs)
+        if (attrs.get('href') or '').startswith('/'):
+            return
+        # Update the attributes in place or add them at the end, like assigning to a BeautifulSoup tag
+        attrs['target'], attrs['rel'] = '_blank', 'noopener noreferrer'
+        line, col = self.getpos()
+        start = self.line_starts[line - 1] + col
+        raw = self.get_starttag_text()
+        tag_html = ''.join(f' {k}' if v is None else f' {k}="{html.escape(v)}"' for k, v in attrs.items())
+        self.edits.append((start, start + len(raw), f'<a{tag_html}{"/>" if raw.endswith("/>") else ">"}'))
+
+    handle_startendtag = handle_starttag
+
+    def rewrite(self) -> str:
+        self.feed(self.html_content)
+        self.close()
+        parts, pos = [], 0
+        for start, end, replacement in self.edits:
+            parts += [self.html_content[pos:start], replacement]
+            pos = end
+        parts.append(self.html_content[pos:])
+        return ''.join(parts)
+
+def _open_links_in_new_window(
+        html_content: str # The HTML to process
+        ) -> str:
+    """Make links that leave the site open in a new window, leaving everything but their start tags untouched."""
+    html_content = str(html_content)
+    if '<a' not in html_content and '<A' not in html_content:
+        return html_content
+    with _phase('links') as phase:
+        phase['data'] = html_content = _LinkRewriter(html_content).rewrite()
+    return html_content
+
+# %% ../nbs/00_core.ipynb 111
+_FENCE_RE = re.compile(r'( {0,3})(`{3,}|~{3,})(.*)')
+_CLOSING_FENCE_RE = re.compile(r' {0,3}(`{3,}|~{3,})[ \t]*')
+
+def _split_fenced_blocks(
+        content: str # The markdown to split
+        ) -> List: # Markdown text alternating with dicts of each block's `info`, `code`, `indent` and `source`
+    """Split markdown on its fenced code blocks in linear time."""
+    parts, text = [], []
+    lines = content.splitlines(keepends=True)
+    i = 0
+    while i < len(lines):
+        match = _FENCE_RE.fullmatch(lines[i].rstrip('\r\n'))
+        # The info string of a backtick fence can't contain backticks
+        if match is None or (match[2][0] == '`' and '`' in match[3]):
+            text.append(lines[i])
+            i += 1
+            continue
+        indent, fence, info = match.groups()
+        end = i + 1
+        while end < len(lines):
+            close = _CLOSING_FENCE_RE.fullmatch(lines[end].rstrip('\r\n'))
+            if close and close[1][0] == fence[0] and len(close[1]) >= len(fence):
+                break
+            end += 1
+        # Remove up to the fence's indentation from each line of code
+        code = ''.join(line[min(len(indent), len(line) - len(line.lstrip(' '))):] for line in lines[i + 1:end])
+        parts += [''.join(text), {'info': info.strip(), 'code': code, 'indent': indent, 'source': ''.join(lines[i:end + 1])}]
+        text = []
+        i = end + 1
+    parts.append(''.join(text))
+    return parts
+
+# %% ../nbs/00_core.ipynb 113
+def _block_placeholder(i: int, nonce: str = '') -> str:
+    "A token that markdown renders as plain text, marking where the `i`th code block goes."
+    return f'FHPOSTS{nonce}BLOCK{i}Z'
+
+def _placeholder_re(nonce: str) -> re.Pattern:
+    "Match the placeholders of one render, with the paragraph markdown wraps them in."
+    return re.compile(rf'(?:<p[^>]*>\s*)?FHPOSTS{nonce}BLOCK(\d+)Z(?:\s*</p>)?')
+
+# %% ../nbs/00_core.ipynb 114
+def iter_markdown_post(
         post: Post, # The post to render
         open_links_new_window: bool = False, 
-        live_label: bool = True
-        ) -> NotStr: # The rendered HTML in a NotStr object (FastHTML object)
-    """Render a Markdown post with code execution."""
+        live_label: bool = True,
+        memo: 'bool|BlockMemo' = False, # The `BlockMemo` to reuse code block outputs from, `True` for the shared `block_memo`
+        executor=None # A `ProcessExecutor` to run the code blocks in instead of this process, `memo` is then not used
+        ) -> Iterator[str]: # The HTML of each markdown segment and code block
+    """Render a Markdown post with code execution, yielding the HTML of each markdown segment and code block as soon as it is ready."""
     
-    with open(post.path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with _phase('read', path=post.path) as phase, open(post.path, 'r', encoding='utf-8') as f:
+        phase['data'] = content = f.read()
     
     # Remove frontmatter if present
     if content.startswith('---'):
@@ -335,38 +1514,47 @@ def render_markdown_post(
         if len(parts) >= 3:
             content = parts[2]
     
-    # Split the content on code blocks
-    parts = re.split(r'```(.*?)```', content, flags=re.DOTALL)
-    
-    # Initialize variables
-    processed_parts = []
-    namespace = {}  # Shared execution namespace for all code blocks
-    
-    # Process each part
+    # Render the markdown in one pass, with a placeholder in place of each Python code block. The placeholders
+    # include a random nonce so text in the post can't be mistaken for one
+    nonce = os.urandom(8).hex()
+    parts = _split_fenced_blocks(content)
+    blocks, markdown = [], []
     for i, part in enumerate(parts):
         if i % 2 == 0:  # Not a code block
-            # Convert markdown to HTML
-            html = str(render_md(part))
-            processed_parts.append(html)
-        else:  # Code block
-            # Extract tag and code
-            lines = part.split('\n', 1)
-            tag_str = lines[0].strip() if lines else ''
-            code = lines[1] if len(lines) > 1 else ''
-            
-            # Skip non-Python code blocks
-            if not tag_str.startswith('python'):
-                processed_parts.append(f'```{part}```')
+            markdown.append(part)
+        elif part['info'].startswith('python'):
+            markdown.append(f"\n{part['indent']}{_block_placeholder(len(blocks), nonce)}\n\n")
+            blocks.append(part)
+        else:  # Other code blocks are rendered as markdown
+            markdown.append(part['source'])
+    with _phase('render_md', path=post.path) as phase:
+        phase['data'] = markdown_html = str(render_md(''.join(markdown)))
+    html_parts = _placeholder_re(nonce).split(markdown_html)
+    
+    # Open links in a new window if needed
+    finish = _open_links_in_new_window if open_links_new_window else str
+    # Runs the code blocks in a shared execution namespace
+    runner = executor.runner() if executor is not None else _BlockRunner(memo, post.path)
+    
+    with runner:
+        # Process each part
+        for i, part in enumerate(html_parts):
+            if i % 2 == 0:  # Rendered markdown
+                if part:
+                    yield finish(part)
                 continue
             
-            # Parse the tag
-            tag_props = parse_tag(tag_str)
+            # Parse the tag of the code block
+            block = blocks[int(part)]
+            tag_props = parse_tag(block['info'])
             
             # Process the code block
-            result = process_code_block(tag_props, code, namespace)
-            namespace = result['namespace']  # Update the namespace
+            with _phase('execute', path=post.path, block=int(part)) as phase:
+                result = runner.process(tag_props, block['code'])
+                phase['data'] = result['output_html']
             
             # Add the processed code and output to the result
+            processed_parts = []
             if result['show_code']:
                 processed_parts.append(result['code_html'])
             
@@ -376,90 +1564,148 @@ def render_markdown_post(
                 if live_label:
                     processed_parts.append('<div class="text-gray-400 text-sm mt-2 italic">↑ Live rendered output</div>')
             processed_parts.append('<div class="mb-8"></div>')
-    
-    # Combine all parts
-    html_content = ''.join(processed_parts)
-    
-    # Process links if needed
-    if open_links_new_window:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        for link in soup.find_all('a'):
-            if not link.get('href', '').startswith('/'):
-                link['target'] = '_blank'
-                link['rel'] = 'noopener noreferrer'
-        html_content = str(soup)
-    
-    return NotStr(html_content)
+            yield finish(''.join(processed_parts))
 
-# %% ../nbs/00_core.ipynb 39
-def render_notebook_post(
+# %% ../nbs/00_core.ipynb 115
+def render_markdown_post(
         post: Post, # The post to render
         open_links_new_window: bool = False, 
-        live_label: bool = True) -> NotStr:
-    """Render a Jupyter Notebook post with code execution."""
+        live_label: bool = True,
+        memo: 'bool|BlockMemo' = False, # The `BlockMemo` to reuse code block outputs from, `True` for the shared `block_memo`
+        executor=None # A `ProcessExecutor` to run the code blocks in instead of this process, `memo` is then not used
+        ) -> NotStr: # The rendered HTML in a NotStr object (FastHTML object)
+    """Render a Markdown post with code execution."""
+    return NotStr(''.join(iter_markdown_post(post, open_links_new_window, live_label, memo, executor)))
+
+# %% ../nbs/00_core.ipynb 120
+def _mimebundle_to_html(data: Dict) -> str:
+    """Convert a display mimebundle to HTML, preferring the richest representation."""
+    def text(mime): 
+        value = data[mime]
+        return ''.join(value) if isinstance(value, list) else value
+    if 'text/html' in data:
+        return text('text/html')
+    if 'image/svg+xml' in data:
+        return text('image/svg+xml')
+    for mime in ('image/png', 'image/jpeg', 'image/gif'):
+        if mime in data:
+            return f'<img src="data:{mime};base64,{text(mime).strip()}">'
+    if 'text/markdown' in data:
+        return str(render_md(text('text/markdown')))
+    if 'text/plain' in data:
+        return f'<pre class="result">{html.escape(text("text/plain"), quote=False)}</pre>'
+    return ''
+
+# %% ../nbs/00_core.ipynb 121
+def outputs_to_html(
+        outputs: List[Dict] # The saved outputs of a notebook code cell
+        ) -> str:
+    """Convert the saved outputs of a notebook cell to HTML without executing it. Handles `stream`,
+    `execute_result`, `display_data` and `error` outputs; consecutive streams are combined like live output."""
+    output_html = []
+    stream = []
+    for output in outputs:
+        output_type = output.get('output_type')
+        if output_type == 'stream':
+            text = output.get('text', '')
+            stream.append(''.join(text) if isinstance(text, list) else text)
+            continue
+        if stream:
+            output_html.append(f'<pre class="output">{html.escape("".join(stream), quote=False)}</pre>')
+            stream = []
+        if output_type in ('execute_result', 'display_data'):
+            output_html.append(_mimebundle_to_html(output.get('data', {})))
+        elif output_type == 'error':
+            output_html.append(f'<pre class="error">{html.escape(output.get("evalue", ""), quote=False)}</pre>')
+    if stream:
+        output_html.append(f'<pre class="output">{html.escape("".join(stream), quote=False)}</pre>')
+    return ''.join(output_html)
+
+# %% ../nbs/00_core.ipynb 123
+def iter_notebook_post(
+        post: Post, # The post to render
+        open_links_new_window: bool = False, 
+        live_label: bool = True,
+        use_stored_outputs: bool = False, # Show saved cell outputs instead of executing cells, overridden by the `use_stored_outputs` frontmatter key
+        memo: 'bool|BlockMemo' = False, # The `BlockMemo` to reuse code cell outputs from, `True` for the shared `block_memo`
+        executor=None # A `ProcessExecutor` to run the code cells in instead of this process, `memo` is then not used
+        ) -> Iterator[str]: # The HTML of each cell
+    """Render a Jupyter Notebook post with code execution, or from the outputs saved in the notebook, yielding the HTML of each cell as soon as it is ready."""
     # Load the notebook
-    notebook = nbformat.read(post.path, as_version=4)
+    with _phase('read', path=post.path) as phase, open(post.path, 'r', encoding='utf-8') as f:
+        phase['data'] = source = f.read()
+    with _phase('parse', path=post.path):
+        notebook = nbformat.reads(source, as_version=4)
+    use_stored_outputs = post.metadata.get('use_stored_outputs', use_stored_outputs)
     
-    # Initialize variables
-    processed_parts = []
-    namespace = {}  # Shared execution namespace
+    # Open links in a new window if needed
+    finish = _open_links_in_new_window if open_links_new_window else str
+    # Runs the code cells in a shared execution namespace
+    runner = executor.runner() if executor is not None else _BlockRunner(memo, post.path)
     
     # Skip the frontmatter cell if present
     start_index = 1 if (len(notebook.cells) > 0 and notebook.cells[0].cell_type == 'raw') else 0
     
-    # Process each cell
-    for cell in notebook.cells[start_index:]:
-        if cell.cell_type == 'markdown':
-            # Convert markdown to HTML
-            html = str(render_md(cell.source))
-            processed_parts.append(html)
+    with runner:
+        # Process each cell
+        for i, cell in enumerate(notebook.cells[start_index:]):
+            if cell.cell_type == 'markdown':
+                # Convert markdown to HTML
+                with _phase('render_md', path=post.path) as phase:
+                    phase['data'] = markdown_html = str(render_md(cell.source))
+                yield finish(markdown_html)
         
-        elif cell.cell_type == 'code':
-            # Extract tag from the first line if present
-            lines = cell.source.split('\n')
-            tag_str = ''
+            elif cell.cell_type == 'code':
+                # Extract tag from the first line if present
+                lines = cell.source.split('\n')
+                tag_str = ''
             
-            # Check if the first line is a tag
-            if lines and re.match(r'^\s*#\|python', lines[0]):
-                # If the tag is just #|python with no options, treat it like the default
-                if lines[0].strip() == '#|python':
-                    tag_str = 'python:run:hide-out'
+                # Check if the first line is a tag
+                if lines and re.match(r'^\s*#\|python', lines[0]):
+                    # If the tag is just #|python with no options, treat it like the default
+                    if lines[0].strip() == '#|python':
+                        tag_str = 'python:run:hide-out'
+                    else:
+                        tag_str = lines[0].strip()[2:]  # Remove the #| prefix
+                    code = '\n'.join(lines[1:])  # Rest of the code
                 else:
-                    tag_str = lines[0].strip()[2:]  # Remove the #| prefix
-                code = '\n'.join(lines[1:])  # Rest of the code
-            else:
-                code = cell.source  # Use the entire cell source 
-                # Default tag for notebook cells (Only set this for cells without explicit tags)
-                tag_str = 'python:run:hide'
+                    code = cell.source  # Use the entire cell source 
+                    # Default tag for notebook cells (Only set this for cells without explicit tags)
+                    tag_str = 'python:run:hide'
             
-            # Parse the tag
-            tag_props = parse_tag(tag_str)
+                # Parse the tag
+                tag_props = parse_tag(tag_str)
             
-            # Process the code cell
-            result = process_code_block(tag_props, code, namespace)
-            namespace = result['namespace']  # Update the namespace
+                # Process the code cell, using its saved outputs instead of running it if requested
+                if use_stored_outputs:
+                    result = process_code_block({**tag_props, 'run': False}, code)
+                    result['output_html'] = outputs_to_html(cell.get('outputs', []))
+                else:
+                    with _phase('execute', path=post.path, cell=i) as phase:
+                        result = runner.process(tag_props, code)
+                        phase['data'] = result['output_html']
             
-            # Add the processed code and output to the result
-            if result['show_code']:
-                processed_parts.append(result['code_html'])
+                # Add the processed code and output to the result
+                processed_parts = []
+                if result['show_code']:
+                    processed_parts.append(result['code_html'])
             
-            if tag_props['run'] and result['show_output'] and result['output_html']:
-                processed_parts.append('<div class="mb-4"></div>')
-                processed_parts.append(result['output_html'])
-                if live_label:
-                    processed_parts.append('<div class="text-gray-400 text-sm mt-2 italic">↑ Live rendered output</div>')
-            processed_parts.append('<div class="mb-8"></div>')
-    
-    # Combine all parts
-    html_content = ''.join(processed_parts)
-    
-    # Process links if needed
-    if open_links_new_window:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        for link in soup.find_all('a'):
-            if not link.get('href', '').startswith('/'):
-                link['target'] = '_blank'
-                link['rel'] = 'noopener noreferrer'
-        html_content = str(soup)
-    
-    return NotStr(html_content)
+                if tag_props['run'] and result['show_output'] and result['output_html']:
+                    processed_parts.append('<div class="mb-4"></div>')
+                    processed_parts.append(result['output_html'])
+                    if live_label and not use_stored_outputs:
+                        processed_parts.append('<div class="text-gray-400 text-sm mt-2 italic">↑ Live rendered output</div>')
+                processed_parts.append('<div class="mb-8"></div>')
+                yield finish(''.join(processed_parts))
+
+# %% ../nbs/00_core.ipynb 124
+def render_notebook_post(
+        post: Post, # The post to render
+        open_links_new_window: bool = False, 
+        live_label: bool = True,
+        use_stored_outputs: bool = False, # Show saved cell outputs instead of executing cells, overridden by the `use_stored_outputs` frontmatter key
+        memo: 'bool|BlockMemo' = False, # The `BlockMemo` to reuse code cell outputs from, `True` for the shared `block_memo`
+        executor=None # A `ProcessExecutor` to run the code cells in instead of this process, `memo` is then not used
+        ) -> NotStr:
+    """Render a Jupyter Notebook post with code execution, or from the outputs saved in the notebook."""
+    return NotStr(''.join(iter_notebook_post(post, open_links_new_window, live_label, use_stored_outputs, memo, executor)))
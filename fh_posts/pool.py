@@ -0,0 +1,239 @@
+"""Run the code blocks of posts in isolated worker processes with timeouts and memory limits."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_pool.ipynb.
+
+# %% auto 0
+__all__ = ['ProcessExecutor']
+
+# %% ../nbs/03_pool.ipynb 3
+import html
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from fastcore.test import *
+from .core import _base_namespace, new_namespace, process_code_block, logger
+
+# %% ../nbs/03_pool.ipynb 5
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+def _rss_mb(pid: int) -> Optional[float]:
+    "Return the resident memory of process `pid` in megabytes, or `None` where `/proc` is unavailable."
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 2**20
+    except (OSError, ValueError, IndexError):
+        return None
+
+# %% ../nbs/03_pool.ipynb 6
+def _worker_main(conn):
+    # Build the template namespace before reporting ready so the first block doesn't pay for the imports
+    _base_namespace()
+    namespace = new_namespace()
+    conn.send('ready')
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break
+        if msg[0] == 'stop':
+            break
+        if msg[0] == 'reset':
+            namespace = new_namespace()
+            continue
+        _, tag_props, code = msg
+        try:
+            result = process_code_block(tag_props, code, namespace)
+            namespace = result['namespace']
+            conn.send(('ok', str(result['output_html'])))
+        except Exception as e:
+            conn.send(('error', f'<pre class="error">{html.escape(str(e))}</pre>'))
+
+# %% ../nbs/03_pool.ipynb 7
+class _Worker:
+    """A worker process and the pipe used to talk to it."""
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child_conn,), name='fh_posts-worker', daemon=True)
+        self.proc.start()
+        child_conn.close()
+        self.ready = False
+
+    def wait_ready(self, timeout: float):
+        if self.ready:
+            return
+        if not self.conn.poll(timeout) or self.conn.recv() != 'ready':
+            raise RuntimeError(f"Worker process {self.proc.pid} failed to start")
+        self.ready = True
+
+    def kill(self):
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.proc.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(('stop',))
+            self.proc.join(1)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+# %% ../nbs/03_pool.ipynb 9
+class ProcessExecutor:
+    """A pool of worker processes that run the code blocks of posts. Each render checks out one worker and runs
+    its blocks there in order, so renders of different posts run in parallel on separate cores. A block that runs
+    longer than `timeout` seconds or grows its worker past `max_rss_mb` megabytes is stopped and the worker replaced."""
+    def __init__(
+            self, # The executor to initialize
+            workers: int = 2, # The number of worker processes
+            timeout: Optional[float] = 30.0, # Seconds a block may run before it is stopped, `None` for no limit
+            max_rss_mb: Optional[float] = None, # Resident memory in megabytes a worker may use, `None` for no limit
+            start_method: Optional[str] = None # The multiprocessing start method, `forkserver` where available else `spawn`
+            ):
+        if start_method is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self._ctx = multiprocessing.get_context(start_method)
+        if start_method == 'forkserver':
+            # Import fasthtml and monsterui once in the fork server so every worker starts with them loaded
+            self._ctx.set_forkserver_preload(['fh_posts.core'])
+        self.workers, self.timeout, self.max_rss_mb = workers, timeout, max_rss_mb
+        self.timeouts = self.memory_kills = 0
+        self._lock = threading.Lock()
+        self._idle = queue.Queue()
+        self._all = set()
+        self._closed = False
+        for _ in range(workers):
+            self._start_worker()
+
+    def _start_worker(self):
+        worker = _Worker(self._ctx)
+        with self._lock:
+            self._all.add(worker)
+        self._idle.put(worker)
+
+    def _checkout(self) -> _Worker:
+        # A worker can die while idle, e.g. killed by the OOM killer, so retry with its replacement
+        for _ in range(self.workers + 1):
+            worker = self._idle.get()
+            if worker is None or self._closed:
+                # `close` puts `None` in the queue to wake the callers waiting for a worker
+                self._idle.put(None)
+                raise RuntimeError("ProcessExecutor is closed")
+            try:
+                worker.wait_ready(timeout=60)
+                worker.conn.send(('reset',))
+                return worker
+            except (RuntimeError, OSError, EOFError) as e:
+                logger.warning(f"Replacing worker process {worker.proc.pid}: {e!r}")
+                self._replace(worker)
+                error = e
+        raise error
+
+    def _checkin(self, worker: _Worker):
+        if self._closed:
+            worker.stop()
+        else:
+            self._idle.put(worker)
+
+    def _replace(self, worker: _Worker):
+        worker.kill()
+        with self._lock:
+            self._all.discard(worker)
+        if not self._closed:
+            self._start_worker()
+
+    def _run(
+            self, # The executor
+            worker: _Worker, # A checked out worker
+            tag_props: Dict[str, bool], # Dict of tag properties
+            code: str # Python code to execute
+            ) -> Tuple[str, Optional[str]]: # The output HTML and the reason the worker was replaced, if it was
+        """Run `code` in `worker`, replacing the worker if the block overruns its time or memory limit."""
+        worker.conn.send(('run', tag_props, code))
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        reason = None
+        while reason is None:
+            if worker.conn.poll(0.05):
+                try:
+                    status, output_html = worker.conn.recv()
+                except EOFError:
+                    reason = "the worker process exited"
+                    break
+                # The block may have left large objects behind in the namespace
+                if self.max_rss_mb is not None and (_rss_mb(worker.proc.pid) or 0) > self.max_rss_mb:
+                    reason = f"the memory limit of {self.max_rss_mb:g}MB was exceeded"
+                    self.memory_kills += 1
+                    break
+                return output_html, None
+            if deadline is not None and time.monotonic() > deadline:
+                reason = f"execution timed out after {self.timeout:g}s"
+                self.timeouts += 1
+            elif self.max_rss_mb is not None and (_rss_mb(worker.proc.pid) or 0) > self.max_rss_mb:
+                reason = f"the memory limit of {self.max_rss_mb:g}MB was exceeded"
+                self.memory_kills += 1
+            elif not worker.proc.is_alive():
+                reason = "the worker process exited"
+        logger.warning(f"Replacing worker process {worker.proc.pid}: {reason}")
+        self._replace(worker)
+        return f'<pre class="error">Stopped: {reason}</pre>', reason
+
+    def runner(self) -> '_PoolRunner':
+        """Return a runner that executes the code blocks of one render in a worker, for use as a context manager."""
+        return _PoolRunner(self)
+
+    def close(self):
+        """Stop all worker processes."""
+        self._closed = True
+        with self._lock:
+            workers, self._all = list(self._all), set()
+        self._idle.put(None)
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f"ProcessExecutor(workers={self.workers}, timeout={self.timeout}, max_rss_mb={self.max_rss_mb})"
+
+# %% ../nbs/03_pool.ipynb 10
+class _PoolRunner:
+    """Run the code blocks of one render in order in a worker checked out from a `ProcessExecutor`."""
+    def __init__(self, executor: ProcessExecutor):
+        self.executor = executor
+        self.worker = None
+        self.error = None  # Why an earlier block was stopped, the blocks after it are not run
+
+    def process(
+            self, # The runner
+            tag_props: Dict[str, bool], # Dict of tag properties
+            code: str # Python code to execute
+            ) -> Dict: # The result of `process_code_block`, with the output of the worker
+        """Process the next code block of the post."""
+        result = process_code_block({**tag_props, 'run': False}, code)
+        if not tag_props['run']:
+            return result
+        if self.error is not None:
+            result['output_html'] = f'<pre class="error">Not run: {self.error} in an earlier block</pre>'
+            return result
+        if self.worker is None:
+            self.worker = self.executor._checkout()
+        result['output_html'], self.error = self.executor._run(self.worker, tag_props, code)
+        if self.error is not None:
+            self.worker = None
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self.worker is not None:
+            self.executor._checkin(self.worker)
+            self.worker = None
@@ -0,0 +1,188 @@
+"""A persistent full-text search index over the posts in a directory."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_search.ipynb.
+
+# %% auto 0
+__all__ = ['FIELD_WEIGHTS', 'post_text', 'tokenize', 'SearchIndex']
+
+# %% ../nbs/04_search.ipynb 3
+from pathlib import Path
+import json
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+import nbformat
+from fastcore.test import *
+from .core import Post, load_post, logger, _split_fenced_blocks, _post_tags, _write_atomic
+from .watch import _SUFFIXES
+
+# %% ../nbs/04_search.ipynb 5
+def post_text(
+        post: Post # The post to extract text from
+        ) -> Dict[str, str]: # The text of the post's `title`, `summary`, `tags` and `body`
+    """Extract the searchable text of a post from its frontmatter and source without rendering it."""
+    fields = {'title': str(post.metadata.get('title', '')), 'summary': str(post.metadata.get('summary', '')),
+              'tags': ' '.join(_post_tags(post))}
+    if post.path.suffix == '.ipynb':
+        notebook = nbformat.read(post.path, as_version=4)
+        cells = notebook.cells[1:] if notebook.cells and notebook.cells[0].cell_type == 'raw' else notebook.cells
+        fields['body'] = '\n'.join(cell.source for cell in cells if cell.cell_type in ('markdown', 'code'))
+    else:
+        content = post.path.read_text(encoding='utf-8')
+        if content.startswith('---'):
+            parts = content.split('---', 2)
+            if len(parts) >= 3:
+                content = parts[2]
+        parts = _split_fenced_blocks(content)
+        fields['body'] = '\n'.join(part if i % 2 == 0 else part['code'] for i, part in enumerate(parts))
+    return fields
+
+# %% ../nbs/04_search.ipynb 7
+_TOKEN_RE = re.compile(r'\w+')
+
+def tokenize(text: str) -> List[str]:
+    "Split `text` into lowercase words."
+    return _TOKEN_RE.findall(text.lower())
+
+# Matches in the title count three times as much as in the body, and in the summary or tags twice as much
+FIELD_WEIGHTS = {'title': 3, 'summary': 2, 'tags': 2, 'body': 1}
+
+# %% ../nbs/04_search.ipynb 10
+_INDEX_VERSION = 1
+
+class SearchIndex:
+    """A BM25 full-text index of the posts in a directory, optionally saved to `index_file`. Call `refresh` to
+    re-index the posts whose files changed, or `update` with the paths that changed."""
+    def __init__(
+            self, # The index to initialize
+            path: str|Path, # The path to the directory containing the posts
+            index_file: Optional[str|Path] = None, # The JSON file to load the index from and `save` it to
+            k1: float = 1.5, # BM25 term frequency saturation
+            b: float = 0.75 # BM25 document length normalization
+            ):
+        self.path = Path(path)
+        self.index_file = Path(index_file) if index_file is not None else None
+        self.k1, self.b = k1, b
+        self._lock = threading.RLock()
+        self._docs = {}  # File name -> slug, title, stat signature, length and distinct terms
+        self._postings = {}  # Term -> {file name: weighted term frequency}
+        self._total_length = 0
+        if self.index_file is not None and self.index_file.exists():
+            self._load()
+        self.refresh()
+
+    def _load(self):
+        try:
+            with open(self.index_file, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable search index {self.index_file}: {e}")
+            return
+        if data.get('version') != _INDEX_VERSION:
+            return
+        self._docs, self._postings = data['docs'], data['postings']
+        self._total_length = sum(doc['length'] for doc in self._docs.values())
+
+    def save(self):
+        """Write the index to `index_file`."""
+        if self.index_file is None:
+            raise ValueError("SearchIndex has no index_file to save to")
+        with self._lock:
+            text = json.dumps({'version': _INDEX_VERSION, 'docs': self._docs, 'postings': self._postings})
+        _write_atomic(self.index_file, text)
+
+    def _add(self, name: str, post: Post, sig: list):
+        terms = Counter()
+        for field, text in post_text(post).items():
+            for term in tokenize(text):
+                terms[term] += FIELD_WEIGHTS[field]
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[name] = tf
+        length = sum(terms.values())
+        self._docs[name] = {'slug': post.slug, 'title': str(post.metadata.get('title', '')), 'sig': sig,
+                            'length': length, 'terms': list(terms)}
+        self._total_length += length
+
+    def _remove(self, name: str) -> bool:
+        doc = self._docs.pop(name, None)
+        if doc is None:
+            return False
+        for term in doc['terms']:
+            postings = self._postings[term]
+            del postings[name]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= doc['length']
+        return True
+
+    def update(
+            self, # The index
+            paths: Iterable[str|Path] # The files that may have been added, changed or removed
+            ) -> Dict[str, List[Path]]:
+        """Re-index the `paths` that changed on disk, returning the added, changed and removed paths."""
+        changes = {'added': [], 'changed': [], 'removed': []}
+        with self._lock:
+            for file_path in paths:
+                file_path = self.path/Path(file_path).name
+                if file_path.suffix not in _SUFFIXES:
+                    continue
+                name = file_path.name
+                try:
+                    st = file_path.stat()
+                    sig = [st.st_size, st.st_mtime_ns]
+                except FileNotFoundError:
+                    sig = None
+                doc = self._docs.get(name)
+                if doc is not None and doc['sig'] == sig:
+                    continue
+                existed = self._remove(name)
+                if sig is None:
+                    if existed:
+                        changes['removed'].append(file_path)
+                    continue
+                try:
+                    self._add(name, load_post(file_path), sig)
+                except Exception as e:
+                    logger.error(f"Error indexing {file_path}: {e}")
+                    if existed:
+                        changes['removed'].append(file_path)
+                    continue
+                changes['changed' if existed else 'added'].append(file_path)
+        return changes
+
+    def refresh(self) -> Dict[str, List[Path]]:
+        """Stat every file in the directory and re-index the posts that were added, changed or removed."""
+        names = {p.name for p in self.path.iterdir() if p.suffix in _SUFFIXES}
+        with self._lock:
+            names |= self._docs.keys()
+        return self.update(sorted(names))
+
+    def search(
+            self, # The index
+            query: str, # The words to search for
+            limit: Optional[int] = 10 # The maximum number of results, `None` for all
+            ) -> List[Tuple[str, float]]: # The slugs of the matching posts and their scores, best first
+        """Rank the posts that contain any of the words in `query` by BM25 score."""
+        scores = Counter()
+        with self._lock:
+            n = len(self._docs)
+            if n == 0:
+                return []
+            avg_length = self._total_length / n
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for name, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._docs[name]['length'] / avg_length)
+                    scores[name] += idf * tf * (self.k1 + 1) / (tf + norm)
+            return [(self._docs[name]['slug'], score) for name, score in scores.most_common(limit)]
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __repr__(self):
+        return f"SearchIndex(path='{self.path}', posts={len(self)}, terms={len(self._postings)})"
@@ -0,0 +1,75 @@
+"""Answer conditional requests for posts with 304 Not Modified instead of rendering them."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_serve.ipynb.
+
+# %% auto 0
+__all__ = ['not_modified', 'post_response']
+
+# %% ../nbs/06_serve.ipynb 3
+import datetime as dt
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Optional
+from fastcore.test import *
+from fasthtml.common import to_xml, Request, Response, HTMLResponse
+from .core import Post
+
+# %% ../nbs/06_serve.ipynb 5
+def _etag_matches(
+        if_none_match: str, # The value of an `If-None-Match` header, e.g. `'W/"a", "b"'` or `'*'`
+        etag: str # The current entity tag of the post
+        ) -> bool:
+    "Whether `etag` is one of the tags in `if_none_match`, comparing weakly as HTTP requires for this header."
+    if if_none_match.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in if_none_match.split(','))
+
+# %% ../nbs/06_serve.ipynb 7
+def not_modified(
+        req: Request, # The request
+        etag: str, # The current entity tag of the resource
+        last_modified: Optional[datetime] = None # The current modification time of the resource, in UTC
+        ) -> bool:
+    """Whether the client's copy of the resource is current, so a GET or HEAD `req` can be answered with 304.
+    `If-None-Match` takes precedence over `If-Modified-Since`, which is only checked when there is no entity tag."""
+    if req.method not in ('GET', 'HEAD'):
+        return False
+    if_none_match = req.headers.get('if-none-match')
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = req.headers.get('if-modified-since')
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        # An invalid date is ignored
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=dt.timezone.utc)
+    return last_modified <= since
+
+# %% ../nbs/06_serve.ipynb 8
+def post_response(
+        req: Request, # The request
+        post: Optional[Post], # The post to serve, `None` for a missing post, which gets a 404 response
+        page: Optional[Callable] = None, # Called with the post and its rendered HTML to build the response body, e.g. a page layout
+        open_links_new_window: bool = False, # Whether to open links in a new window
+        live_label: bool = True, # Whether to show the live label
+        use_stored_outputs: bool = False, # Show the outputs saved in a notebook instead of executing its cells
+        cache=True, # The `RenderCache` to use, `True` for the shared `render_cache` or `False` to always re-render
+        executor=None, # A `ProcessExecutor` to run the code blocks in instead of this process
+        cache_control: str = 'no-cache' # The `Cache-Control` header, by default clients revalidate before each use
+        ) -> Response:
+    """Return the rendered post with `ETag` and `Last-Modified` headers, or an empty 304 response without rendering
+    the post when the request's `If-None-Match` or `If-Modified-Since` header shows the client's copy is current.
+    The body built by `page` should only depend on the post, since other changes to it won't change the headers."""
+    if post is None:
+        return HTMLResponse('Not Found', status_code=404)
+    etag = post.etag(open_links_new_window, live_label, use_stored_outputs)
+    last_modified = post.last_modified
+    headers = {'ETag': etag, 'Last-Modified': format_datetime(last_modified, usegmt=True), 'Cache-Control': cache_control}
+    if not_modified(req, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    html = post.render(open_links_new_window, live_label, cache, use_stored_outputs, executor)
+    return HTMLResponse(to_xml(page(post, html) if page else html), headers=headers)
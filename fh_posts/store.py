@@ -0,0 +1,101 @@
+"""Persistent storage for rendered posts that is shared across server processes."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_store.ipynb.
+
+# %% auto 0
+__all__ = ['SqliteRenderStore']
+
+# %% ../nbs/01_store.ipynb 3
+from pathlib import Path
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from fastcore.test import *
+
+# %% ../nbs/01_store.ipynb 5
+class SqliteRenderStore:
+    """A persistent key-value store for rendered post HTML backed by a SQLite file. It is safe to share
+    between threads and between processes, e.g. several uvicorn workers. The oldest renders are removed once
+    there are more than `max_rows`."""
+    def __init__(
+            self, # The store to initialize
+            path: str|Path, # The path to the SQLite database file
+            timeout: float = 30.0, # Seconds to wait for a lock held by another process
+            max_rows: Optional[int] = 10_000 # The maximum number of renders to keep, `None` for no limit
+            ):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.max_rows = max_rows
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS renders (key TEXT PRIMARY KEY, html TEXT NOT NULL, created REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS renders_created ON renders (created)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections can't be shared across threads or forked processes, so keep one per thread and pid
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(
+            self, # The store
+            key: str # The render key
+            ) -> Optional[str]:
+        """Return the HTML stored under `key` or `None`."""
+        row = self._connect().execute("SELECT html FROM renders WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(
+            self, # The store
+            key: str, # The render key
+            html: str # The rendered HTML
+            ):
+        """Store `html` under `key`, replacing any previous value, and remove the oldest renders beyond `max_rows`."""
+        conn = self._connect()
+        conn.execute("INSERT OR REPLACE INTO renders (key, html, created) VALUES (?, ?, ?)", (key, str(html), time.time()))
+        if self.max_rows is not None:
+            conn.execute("DELETE FROM renders WHERE key IN (SELECT key FROM renders ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                         (self.max_rows,))
+
+    def delete(self, key: str):
+        """Remove the HTML stored under `key` if present."""
+        self._connect().execute("DELETE FROM renders WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str):
+        """Remove the HTML stored under every key starting with `prefix`, e.g. all renders of one content hash."""
+        self._connect().execute("DELETE FROM renders WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+    def prune(
+            self, # The store
+            max_age: float # Seconds a render is kept for
+            ) -> int: # The number of renders removed
+        """Remove the renders stored more than `max_age` seconds ago."""
+        return self._connect().execute("DELETE FROM renders WHERE created < ?", (time.time() - max_age,)).rowcount
+
+    def clear(self):
+        """Remove all stored renders."""
+        self._connect().execute("DELETE FROM renders")
+
+    def __contains__(self, key: str):
+        return self._connect().execute("SELECT 1 FROM renders WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM renders").fetchone()[0]
+
+    def __getstate__(self):
+        # Drop the open connections so the store can be sent to other processes
+        return {'path': self.path, 'timeout': self.timeout, 'max_rows': self.max_rows}
+
+    def __setstate__(self, state):
+        self.path, self.timeout, self.max_rows = state['path'], state['timeout'], state['max_rows']
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f"SqliteRenderStore(path='{self.path}')"
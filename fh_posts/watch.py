@@ -0,0 +1,258 @@
+"""A long-lived, hot-reloading index of the posts in a directory."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_watch.ipynb.
+
+# %% auto 0
+__all__ = ['PostIndex']
+
+# %% ../nbs/02_watch.ipynb 3
+from pathlib import Path
+import bisect
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional
+from fastcore.test import *
+from .core import Post, load_post, load_posts, get_post_date, logger, _sort_key
+
+# %% ../nbs/02_watch.ipynb 5
+# inotify event flags, see `man 7 inotify`
+_IN_ATTRIB, _IN_CLOSE_WRITE, _IN_MOVED_FROM, _IN_MOVED_TO = 0x4, 0x8, 0x40, 0x80
+_IN_CREATE, _IN_DELETE, _IN_DELETE_SELF, _IN_MOVE_SELF = 0x100, 0x200, 0x400, 0x800
+_IN_NONBLOCK, _IN_CLOEXEC = 0o4000, 0o2000000
+_EVENT_HEADER = struct.Struct('iIII')
+
+class _Inotify:
+    """Watch a directory for file changes with Linux inotify."""
+    def __init__(self, path: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = (_IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO |
+                _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF)
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {path}")
+
+    def read(
+            self, # The watcher
+            timeout: float # Seconds to wait for events
+            ) -> set:
+        """Return the names of the files that changed, waiting up to `timeout` seconds for the first event."""
+        names = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name:
+                    names.add(os.fsdecode(name))
+            ready, _, _ = select.select([self.fd], [], [], 0)
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+# %% ../nbs/02_watch.ipynb 6
+def _inotify_available() -> bool:
+    return sys.platform.startswith('linux') and ctypes.util.find_library('c') is not None
+
+# %% ../nbs/02_watch.ipynb 8
+_SUFFIXES = ('.md', '.ipynb')
+
+class PostIndex:
+    """A long-lived index of the posts in a directory that stays sorted by date, newest first, and supports
+    slug lookups. Call `refresh` to pick up changes, or `start` a background thread that watches the
+    directory with inotify, falling back to polling modification times."""
+    def __init__(
+            self, # The index to initialize
+            path: str|Path, # The path to the directory containing the posts
+            date_format: str = "%B %d, %Y", # The format string for the date i.e. "January 01, 2025"
+            poll_interval: float = 1.0, # Seconds between scans when polling for changes
+            use_inotify: bool = True, # Whether to use inotify when available instead of polling
+            manifest: bool|str|Path = False # Manifest to speed up the initial load, see `load_posts`
+            ):
+        self.path = Path(path)
+        self.date_format = date_format
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and _inotify_available()
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._keys = []  # Sort keys parallel to `_posts`
+        self._posts = []
+        self._by_path = {}
+        self._by_slug = {}
+        self._stats = self._scan()
+        for post in load_posts(self.path, date_format, manifest=manifest):
+            self._insert(post)
+
+    def _sort_key(self, post: Post) -> tuple:
+        # The same order as `load_posts` and `PostCollection.page`
+        return _sort_key(get_post_date(post, self.date_format), post.path)
+
+    def _scan(self) -> Dict[Path, tuple]:
+        stats = {}
+        for file_path in self.path.iterdir():
+            if file_path.suffix in _SUFFIXES:
+                try:
+                    st = file_path.stat()
+                except FileNotFoundError:
+                    continue
+                stats[file_path] = (st.st_size, st.st_mtime_ns)
+        return stats
+
+    def _insert(self, post: Post):
+        key = self._sort_key(post)
+        i = bisect.bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._posts.insert(i, post)
+        self._by_path[post.path] = post
+        # Like `PostCollection.get`, a slug shared by several files belongs to the first of them in order
+        other = self._by_slug.get(post.slug)
+        if other is None or key < self._sort_key(other):
+            self._by_slug[post.slug] = post
+
+    def _remove(self, file_path: Path) -> Optional[Post]:
+        post = self._by_path.pop(file_path, None)
+        if post is None:
+            return None
+        i = bisect.bisect_left(self._keys, self._sort_key(post))
+        del self._keys[i], self._posts[i]
+        if self._by_slug.get(post.slug) is post:
+            del self._by_slug[post.slug]
+            # Another file may share the slug, e.g. `hello.md` and `hello.ipynb`
+            others = [p for p in self._by_path.values() if p.slug == post.slug]
+            if others:
+                self._by_slug[post.slug] = min(others, key=self._sort_key)
+        return post
+
+    def update(
+            self, # The index
+            paths: Iterable[str|Path] # The files that may have been added, changed or removed
+            ) -> Dict[str, List[Path]]:
+        """Re-extract the frontmatter of `paths` that changed on disk, returning the added, changed and removed paths."""
+        changes = {'added': [], 'changed': [], 'removed': []}
+        with self._lock:
+            for file_path in paths:
+                file_path = Path(file_path)
+                if file_path.parent != self.path:
+                    file_path = self.path/file_path.name
+                if file_path.suffix not in _SUFFIXES:
+                    continue
+                try:
+                    st = file_path.stat()
+                    sig = (st.st_size, st.st_mtime_ns)
+                except FileNotFoundError:
+                    sig = None
+
+                old_sig = self._stats.get(file_path)
+                if sig == old_sig and (sig is None or file_path in self._by_path):
+                    continue
+                existed = self._remove(file_path) is not None
+                if sig is None:
+                    del self._stats[file_path]
+                    if existed:
+                        changes['removed'].append(file_path)
+                    continue
+
+                self._stats[file_path] = sig
+                try:
+                    self._insert(load_post(file_path))
+                except Exception as e:
+                    logger.error(f"Error processing {file_path}: {e}")
+                    if existed:
+                        changes['removed'].append(file_path)
+                    continue
+                changes['changed' if existed else 'added'].append(file_path)
+        return changes
+
+    def refresh(self) -> Dict[str, List[Path]]:
+        """Stat every file in the directory and update the posts that were added, changed or removed."""
+        stats = self._scan()
+        with self._lock:
+            paths = [p for p in stats.keys() | self._stats.keys() if stats.get(p) != self._stats.get(p)]
+        return self.update(paths)
+
+    def _watch(self):
+        watcher = None
+        if self.use_inotify:
+            try:
+                watcher = _Inotify(self.path)
+            except OSError as e:
+                logger.warning(f"inotify unavailable for {self.path}, polling instead: {e}")
+        # Catch anything that changed before the watch was set up
+        self.refresh()
+        try:
+            while not self._stop.is_set():
+                if watcher is None:
+                    self._stop.wait(self.poll_interval)
+                    self.refresh()
+                    continue
+                names = watcher.read(timeout=self.poll_interval)
+                if names:
+                    self.update(self.path/name for name in names)
+        except Exception as e:
+            logger.error(f"Stopped watching {self.path}: {e}")
+        finally:
+            if watcher is not None:
+                watcher.close()
+
+    def start(self) -> 'PostIndex':
+        """Start watching the directory for changes in a background thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name=f"PostIndex({self.path})", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching the directory."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def posts(self) -> List[Post]:
+        """A snapshot of the posts, newest first."""
+        with self._lock:
+            return list(self._posts)
+
+    def get(self, slug: str, default=None) -> Optional[Post]:
+        """Return the post with `slug` or `default`."""
+        return self._by_slug.get(slug, default)
+
+    def __getitem__(self, slug: str) -> Post:
+        return self._by_slug[slug]
+
+    def __contains__(self, slug: str):
+        return slug in self._by_slug
+
+    def __iter__(self):
+        return iter(self.posts)
+
+    def __len__(self):
+        return len(self._posts)
+
+    def __repr__(self):
+        return f"PostIndex(path='{self.path}', posts={len(self)})"